@@ -5,8 +5,10 @@
 
 import asyncio
 import logging
+from contextlib import aclosing
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from operator import itemgetter
+from typing import Dict, Any, Optional
 import signal
 import sys
 
@@ -181,12 +183,16 @@ class BotController:
                         await asyncio.sleep(10)
                         continue
                         
-                    # Анализ рынка и поиск сигналов
-                    signals = await self.core.signal_analyzer.analyze_all_pairs(market_data)
+                    # Анализ рынка: сигналы одного прохода собираются и сортируются по точности,
+                    # чтобы часовой лимит и интервал между сигналами доставались лучшим, а не самым быстрым
+                    analysis = self.core.signal_analyzer.analyze_all_pairs(market_data)
+                    async with aclosing(analysis):
+                        signals = [signal async for signal in analysis]
+                    signals.sort(key=itemgetter('accuracy'), reverse=True)
                     
-                    # Обработка найденных сигналов
-                    if signals:
-                        await self._process_signals(signals)
+                    for signal in signals:
+                        if not await self._process_signal(signal):
+                            break
                         
                     # Обновление статистики
                     self.total_cycles += 1
@@ -216,51 +222,45 @@ class BotController:
         finally:
             logger.info("🔄 Основной торговый цикл завершен")
             
-    async def _process_signals(self, signals: List[Dict[str, Any]]):
-        """Обработка найденных сигналов"""
+    async def _process_signal(self, signal: Dict[str, Any]) -> bool:
+        """Обработка одного сигнала; False - лимиты исчерпаны, дальнейшие сигналы не нужны"""
         try:
-            logger.info(f"📊 Обработка {len(signals)} сигналов...")
+            # Валидация сигнала
+            if not await self._validate_signal(signal):
+                return True
+                
+            # Проверка лимитов
+            if not self._check_signal_limits():
+                logger.warning("⚠️ Превышены лимиты сигналов")
+                return False
+                
+            # Отправка сигнала
+            success = await self.telegram.send_signal(signal)
             
-            for signal in signals:
-                try:
-                    # Валидация сигнала
-                    if not await self._validate_signal(signal):
-                        continue
-                        
-                    # Проверка лимитов
-                    if not self._check_signal_limits():
-                        logger.warning("⚠️ Превышены лимиты сигналов")
-                        break
-                        
-                    # Отправка сигнала
-                    success = await self.telegram.send_signal(signal)
-                    
-                    if success:
-                        # Сохранение в базу данных
-                        signal_id = await self.core.database.save_signal(signal)
-                        
-                        # Обновление счетчиков
-                        self.signals_sent_today += 1
-                        self.signals_sent_hour += 1
-                        self.last_signal_time = datetime.now()
-                        
-                        # Обновление глобальной статистики
-                        import globals
-                        globals.performance_stats['total_signals'] += 1
-                        globals.performance_stats['daily_signals'] += 1
-                        globals.performance_stats['hourly_signals'] += 1
-                        
-                        logger.info(f"✅ Сignal отправлен: {signal['pair']} {signal['timeframe']}")
-                        
-                    else:
-                        logger.error(f"❌ Ошибка отправки сигнала: {signal['pair']} {signal['timeframe']}")
-                        
-                except Exception as e:
-                    logger.error(f"Ошибка обработки сигнала: {e}")
-                    continue
-                    
+            if success:
+                # Сохранение в базу данных
+                signal_id = await self.core.database.save_signal(signal)
+                
+                # Обновление счетчиков
+                self.signals_sent_today += 1
+                self.signals_sent_hour += 1
+                self.last_signal_time = datetime.now()
+                
+                # Обновление глобальной статистики
+                import globals
+                globals.performance_stats['total_signals'] += 1
+                globals.performance_stats['daily_signals'] += 1
+                globals.performance_stats['hourly_signals'] += 1
+                
+                logger.info(f"✅ Сignal отправлен: {signal['pair']} {signal['timeframe']}")
+                
+            else:
+                logger.error(f"❌ Ошибка отправки сигнала: {signal['pair']} {signal['timeframe']}")
+                
         except Exception as e:
-            logger.error(f"Ошибка обработки сигналов: {e}")
+            logger.error(f"Ошибка обработки сигнала: {e}")
+            
+        return True
             
     async def _validate_signal(self, signal: Dict[str, Any]) -> bool:
         """Валидация сигнала"""
@@ -8,6 +8,8 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import os
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
 from globals import TRADING_PAIRS, TIMEFRAMES, STRATEGY_CONFIG
 from database import Database
@@ -42,6 +44,10 @@ class TradingCore:
         self.successful_analysis_cycles = 0
         self.total_signals_generated = 0
         
+        # Пул потоков для расчета индикаторов: кадры не сериализуются, ядра Numba (nogil) и векторный
+        # NumPy отпускают GIL, но pandas ewm/rolling его держат - поэтому пул небольшой
+        self.pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='indicators')
+        
     async def initialize(self):
         """Инициализация торгового ядра"""
         try:
@@ -88,7 +94,7 @@ class TradingCore:
         try:
             logger.info("🔍 Инициализация анализатора сигналов...")
             
-            self.signal_analyzer = SignalAnalyzer(self.telegram, self.database)
+            self.signal_analyzer = SignalAnalyzer(self.telegram, self.database, executor=self.pool)
             
             logger.info("✅ Анализатор сигналов инициализирован")
             
@@ -297,7 +303,10 @@ class TradingCore:
             self.total_analysis_cycles += 1
             
             # Анализ через анализатор сигналов
-            signals = await self.signal_analyzer.analyze_all_pairs(market_data)
+            signals = [signal async for signal in self.signal_analyzer.analyze_all_pairs(market_data)]
+            
+            # Сортируем сигналы по точности
+            signals.sort(key=itemgetter('accuracy'), reverse=True)
             
             if signals:
                 self.total_signals_generated += len(signals)
@@ -349,6 +358,9 @@ class TradingCore:
             if self.websocket:
                 await self.websocket.shutdown()
                 
+            # Остановка пула расчета индикаторов
+            self.pool.shutdown(wait=False, cancel_futures=True)
+                
             # Сохранение AI модели
             if self.ai_predictor:
                 try:
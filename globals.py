@@ -16,6 +16,12 @@ CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "your_chat_id")
 # WebSocket Binance
 BINANCE_WS_URL = "wss://stream.binance.com:9443/ws"
 
+# REST Binance для загрузки истории свечей
+BINANCE_REST_URL = "https://api.binance.com/api/v3/klines"
+
+# Симуляция рыночных данных вместо загрузки истории с Binance
+SIMULATE_MARKET_DATA = os.getenv("SIMULATE_MARKET_DATA", "1") == "1"
+
 # База данных
 DB_PATH = "./trading_signals.db"
 DATABASE_CONFIG = {
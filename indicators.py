@@ -1,375 +1,498 @@
 import numpy as np
 import pandas as pd
 import logging
+from functools import lru_cache
+from numpy.lib.stride_tricks import sliding_window_view
 
 from globals import INDICATORS_CONFIG, STRATEGY_CONFIG
+from _njit import njit
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck не установлен - используем pandas.rolling
+    bn = None
 
 logger = logging.getLogger(__name__)
 
+# Точности float32 достаточно для индикаторов, а объем данных вдвое меньше
+_FLOAT32_COLUMNS = {column: np.float32 for column in ('open', 'high', 'low', 'close', 'volume')}
+_REQUIRED_COLUMNS = frozenset(_FLOAT32_COLUMNS)
+
+
+def _move_mean(values, window):
+    """Скользящее среднее по массиву (NaN для первых window-1 значений)"""
+    if bn is not None:
+        return bn.move_mean(values, window)
+    return pd.Series(values).rolling(window=window).mean().to_numpy()
+
+
+@lru_cache(maxsize=64)
+def _ema_weights(span, depth):
+    """Нормированные веса EMA (как у ewm(span).mean()) для последних depth значений"""
+    alpha = 2 / (span + 1)
+    weights = (1 - alpha) ** np.arange(depth - 1, -1, -1)
+    weights /= weights.sum()
+    weights.setflags(write=False)
+    return weights
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _psar_kernel(high, low, acceleration, maximum):
+    """Parabolic SAR: последовательный проход с переносом состояния тренда"""
+    n = high.shape[0]
+    sar = np.empty(n, dtype=high.dtype)
+    trend = 1
+    af = acceleration
+    ep = high[0]
+    sar[0] = low[0]
+    
+    for i in range(1, n):
+        if trend == 1:
+            sar[i] = sar[i - 1] + af * (ep - sar[i - 1])
+            
+            if high[i] > ep:
+                ep = high[i]
+                af = min(af + acceleration, maximum)
+                
+            if low[i] < sar[i]:
+                trend = -1
+                sar[i] = ep
+                af = acceleration
+                ep = low[i]
+        else:
+            sar[i] = sar[i - 1] - af * (sar[i - 1] - ep)
+            
+            if low[i] < ep:
+                ep = low[i]
+                af = min(af + acceleration, maximum)
+                
+            if high[i] > sar[i]:
+                trend = 1
+                sar[i] = ep
+                af = acceleration
+                ep = high[i]
+                
+    return sar
+
+
+@njit(cache=True, nogil=True)
+def _wilder_rma(values, period):
+    """Сглаживание Уайлдера: старт со среднего первых period значений, далее рекурсия"""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+    
+    average = values[:period].mean()
+    out[period - 1] = average
+    for i in range(period, n):
+        average += (values[i] - average) / period
+        out[i] = average
+        
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _adx_kernel(high, low, close, period):
+    """ADX Уайлдера за один проход: +DM/-DM, TR, сглаженные DI+/DI-, DX и ADX"""
+    n = high.shape[0]
+    adx = np.full(n, np.nan)
+    if n < 2 * period:
+        return adx
+    
+    tr_sum = 0.0
+    plus_sum = 0.0
+    minus_sum = 0.0
+    dx_sum = 0.0
+    value = 0.0
+    
+    for i in range(1, n):
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        plus_dm = up if up > down and up > 0 else 0.0
+        minus_dm = down if down > up and down > 0 else 0.0
+        true_range = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        
+        if i <= period:
+            tr_sum += true_range
+            plus_sum += plus_dm
+            minus_sum += minus_dm
+            if i < period:
+                continue
+        else:
+            tr_sum += true_range - tr_sum / period
+            plus_sum += plus_dm - plus_sum / period
+            minus_sum += minus_dm - minus_sum / period
+            
+        di_total = plus_sum + minus_sum
+        dx = 100.0 * abs(plus_sum - minus_sum) / di_total if di_total > 0 else 0.0
+        
+        # Первое значение ADX - среднее первых period значений DX
+        if i < 2 * period - 1:
+            dx_sum += dx
+        elif i == 2 * period - 1:
+            value = (dx_sum + dx) / period
+            adx[i] = value
+        else:
+            value += (dx - value) / period
+            adx[i] = value
+            
+    return adx
+
+
 class TechnicalIndicators:
+    # Центрированные x для наклона по последним 5 точкам
+    _SLOPE_WINDOW = 5
+    _SLOPE_X = np.arange(_SLOPE_WINDOW, dtype=np.float32) - (_SLOPE_WINDOW - 1) / 2
+    _SLOPE_XX = float(_SLOPE_X @ _SLOPE_X)
+    
+    __slots__ = (
+        'config', 'strategy_config',
+        'sma_periods', 'ema_periods', 'rsi_period',
+        'macd_fast', 'macd_slow', 'macd_signal',
+        'bb_period', 'bb_std', 'volume_sma_period',
+        'stoch_k', 'stoch_d', 'williams_period', 'cci_period', 'adx_period',
+        'sar_acceleration', 'sar_maximum',
+        'vwap_gradient_threshold', 'volume_multiplier',
+    )
+    
     def __init__(self):
         self.config = INDICATORS_CONFIG
         self.strategy_config = STRATEGY_CONFIG
         
+        # Параметры читаются из конфигурации один раз, а не на каждом расчете
+        config = self.config
+        self.sma_periods = tuple(config['sma_periods'])
+        self.ema_periods = tuple(config['ema_periods'])
+        self.rsi_period = config['rsi_period']
+        self.macd_fast = config['macd_fast']
+        self.macd_slow = config['macd_slow']
+        self.macd_signal = config['macd_signal']
+        self.bb_period = config['bollinger_period']
+        self.bb_std = config['bollinger_std']
+        self.volume_sma_period = config['volume_sma_period']
+        self.stoch_k = config['stoch_k']
+        self.stoch_d = config['stoch_d']
+        self.williams_period = config['williams_period']
+        self.cci_period = config['cci_period']
+        self.adx_period = config['adx_period']
+        self.sar_acceleration = float(config['parabolic_sar']['acceleration'])
+        self.sar_maximum = float(config['parabolic_sar']['maximum'])
+        self.vwap_gradient_threshold = self.strategy_config['vwap_gradient_threshold']
+        self.volume_multiplier = self.strategy_config['volume_multiplier']
+        
     def calculate_all_indicators(self, data):
-        try:
-            if len(data) < 200:
-                return {}
-                
-            indicators = {}
-            
-            indicators.update(self._calculate_moving_averages(data))
-            indicators.update(self._calculate_rsi(data))
-            indicators.update(self._calculate_macd(data))
-            indicators.update(self._calculate_bollinger_bands(data))
-            indicators.update(self._calculate_volume_indicators(data))
-            indicators.update(self._calculate_momentum_indicators(data))
-            indicators.update(self._calculate_volatility_indicators(data))
-            
-            indicators.update(self._calculate_vwap_gradient(data))
-            indicators.update(self._calculate_volume_tsunami(data))
-            indicators.update(self._calculate_neural_macd(data))
-            indicators.update(self._calculate_quantum_rsi(data))
-            
-            return indicators
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета индикаторов: {e}")
-            return {}
-            
-    def _calculate_moving_averages(self, data):
-        try:
-            result = {}
-            
-            for period in self.config['sma_periods']:
-                result[f'sma_{period}'] = data['close'].rolling(window=period).mean().iloc[-1]
-            
-            for period in self.config['ema_periods']:
-                result[f'ema_{period}'] = data['close'].ewm(span=period).mean().iloc[-1]
-                
-            result['sma_20_slope'] = self._calculate_slope(data['close'].rolling(window=20).mean())
-            result['ema_crossover'] = 1 if result['ema_9'] > result['ema_21'] else 0
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета MA: {e}")
-            return {}
-            
-    def _calculate_rsi(self, data):
-        try:
-            period = self.config['rsi_period']
-            
-            delta = data['close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            return {
-                'rsi': rsi.iloc[-1],
-                'rsi_overbought': 1 if rsi.iloc[-1] > 70 else 0,
-                'rsi_oversold': 1 if rsi.iloc[-1] < 30 else 0,
-                'rsi_divergence': self._calculate_rsi_divergence(data, rsi)
-            }
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета RSI: {e}")
-            return {}
-            
-    def _calculate_macd(self, data):
-        try:
-            fast = self.config['macd_fast']
-            slow = self.config['macd_slow']
-            signal = self.config['macd_signal']
-            
-            ema_fast = data['close'].ewm(span=fast).mean()
-            ema_slow = data['close'].ewm(span=slow).mean()
-            
-            macd_line = ema_fast - ema_slow
-            macd_signal = macd_line.ewm(span=signal).mean()
-            macd_histogram = macd_line - macd_signal
-            
-            return {
-                'macd': macd_line.iloc[-1],
-                'macd_signal': macd_signal.iloc[-1],
-                'macd_histogram': macd_histogram.iloc[-1],
-                'macd_crossover': 1 if macd_line.iloc[-1] > macd_signal.iloc[-1] else 0,
-                'macd_divergence': self._calculate_macd_divergence(data, macd_line)
-            }
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета MACD: {e}")
+        # Недостаточно истории или нет нужных колонок - расчет не выполняется
+        if len(data) < 200 or not _REQUIRED_COLUMNS.issubset(data.columns):
             return {}
             
-    def _calculate_bollinger_bands(self, data):
+        # Единая защита: при ошибке в любой группе результат целиком отбрасывается
         try:
-            period = self.config['bollinger_period']
-            std_dev = self.config['bollinger_std']
-            
-            sma = data['close'].rolling(window=period).mean()
-            std = data['close'].rolling(window=period).std()
-            
-            upper_band = sma + (std * std_dev)
-            lower_band = sma - (std * std_dev)
-            
-            current_price = data['close'].iloc[-1]
-            
-            return {
-                'bb_upper': upper_band.iloc[-1],
-                'bb_middle': sma.iloc[-1],
-                'bb_lower': lower_band.iloc[-1],
-                'bb_width': (upper_band.iloc[-1] - lower_band.iloc[-1]) / sma.iloc[-1],
-                'bb_position': (current_price - lower_band.iloc[-1]) / (upper_band.iloc[-1] - lower_band.iloc[-1]),
-                'bb_squeeze': 1 if (upper_band.iloc[-1] - lower_band.iloc[-1]) / sma.iloc[-1] < 0.1 else 0
-            }
+            # Деление на ноль (плоские окна) дает inf/NaN, как и в pandas
+            with np.errstate(divide='ignore', invalid='ignore'):
+                data = data.astype(_FLOAT32_COLUMNS)
+                indicators = {}
+            
+                # Значения последней свечи читаются один раз для всех групп
+                last_bar = {column: data[column].to_numpy()[-1] for column in _FLOAT32_COLUMNS}
+            
+                # Общие ряды, которые используются несколькими группами индикаторов
+                close = data['close']
+                ema_spans = {self.macd_fast, self.macd_slow}
+                ema_cache = {span: close.ewm(span=span).mean().to_numpy() for span in ema_spans}
+                sma_periods = set(self.sma_periods) | {20, self.bb_period}
+                close_values = close.to_numpy()
+                sma_cache = {period: _move_mean(close_values, period) for period in sma_periods}
+            
+                macd_line, macd_signal = self._calculate_macd_lines(ema_cache)
+                volume_sma = data['volume'].rolling(window=self.volume_sma_period).mean().to_numpy()
+                vwap = self._calculate_vwap(data)
+                atr = self._calculate_atr(data)
+            
+                indicators.update(self._calculate_moving_averages(data, ema_cache, sma_cache))
+                indicators.update(self._calculate_rsi(data))
+                indicators.update(self._calculate_macd(data, macd_line, macd_signal))
+                indicators.update(self._calculate_bollinger_bands(data, sma_cache, last_bar))
+                indicators.update(self._calculate_volume_indicators(data, volume_sma, vwap, last_bar))
+                indicators.update(self._calculate_momentum_indicators(data))
+                indicators.update(self._calculate_volatility_indicators(data, atr, last_bar))
+            
+                indicators.update(self._calculate_vwap_gradient(data, vwap))
+                indicators.update(self._calculate_volume_tsunami(data, volume_sma))
+                indicators.update(self._calculate_neural_macd(data, macd_line, macd_signal))
+                indicators.update(self._calculate_quantum_rsi(indicators.get('rsi'), volume_sma, last_bar))
+            
+                return indicators
             
         except Exception as e:
-            logger.error(f"Ошибка расчета Bollinger Bands: {e}")
+            logger.error(f"Ошибка расчета индикаторов: {e}")
             return {}
             
-    def _calculate_volume_indicators(self, data):
-        try:
-            result = {}
-            
-            vol_sma = data['volume'].rolling(window=self.config['volume_sma_period']).mean()
-            result['volume_sma'] = vol_sma.iloc[-1]
-            result['volume_ratio'] = data['volume'].iloc[-1] / vol_sma.iloc[-1]
-            
-            obv = self._calculate_obv(data)
-            result['obv'] = obv.iloc[-1]
-            result['obv_trend'] = self._calculate_slope(obv)
-            
-            vwap = self._calculate_vwap(data)
-            result['vwap'] = vwap.iloc[-1]
-            result['vwap_deviation'] = (data['close'].iloc[-1] - vwap.iloc[-1]) / vwap.iloc[-1]
-            
-            mfi = self._calculate_mfi(data)
-            result['mfi'] = mfi.iloc[-1]
-            
-            return result
+    def _calculate_moving_averages(self, data, ema_cache, sma_cache):
+        result = {}
+        close = data['close'].to_numpy()
+        
+        for period in self.sma_periods:
+            result[f'sma_{period}'] = sma_cache[period][-1]
+        
+        for period in self.ema_periods:
+            if period in ema_cache:
+                result[f'ema_{period}'] = ema_cache[period][-1]
+            else:
+                result[f'ema_{period}'] = _ema_weights(period, len(close)) @ close
             
-        except Exception as e:
-            logger.error(f"Ошибка расчета объемных индикаторов: {e}")
-            return {}
+        result['sma_20_slope'] = self._calculate_slope(sma_cache[20])
+        result['ema_crossover'] = 1 if result['ema_9'] > result['ema_21'] else 0
+        
+        return result
+        
+    def _calculate_rsi(self, data):
+        period = self.rsi_period
+        
+        delta = np.diff(data['close'].to_numpy())
+        gain = _wilder_rma(np.maximum(delta, 0), period)
+        loss = _wilder_rma(np.maximum(-delta, 0), period)
+        
+        rsi = np.concatenate(([np.nan], 100 - (100 / (1 + gain / loss))))
+        rsi_last = rsi[-1]
+        
+        return {
+            'rsi': rsi_last,
+            'rsi_overbought': 1 if rsi_last > 70 else 0,
+            'rsi_oversold': 1 if rsi_last < 30 else 0,
+            'rsi_divergence': self._calculate_rsi_divergence(data, rsi)
+        }
+        
+    def _calculate_macd_lines(self, ema_cache):
+        """Линия MACD и сигнальная линия (общие для MACD и Neural MACD)"""
+        signal = self.macd_signal
+        
+        ema_fast = ema_cache[self.macd_fast]
+        ema_slow = ema_cache[self.macd_slow]
+        
+        macd_line = ema_fast - ema_slow
+        macd_signal = pd.Series(macd_line).ewm(span=signal).mean().to_numpy()
+        return macd_line, macd_signal
             
+    def _calculate_macd(self, data, macd_line, macd_signal):
+        macd_last = macd_line[-1]
+        signal_last = macd_signal[-1]
+        
+        return {
+            'macd': macd_last,
+            'macd_signal': signal_last,
+            'macd_histogram': macd_last - signal_last,
+            'macd_crossover': 1 if macd_last > signal_last else 0,
+            'macd_divergence': self._calculate_macd_divergence(data, macd_line)
+        }
+        
+    def _calculate_bollinger_bands(self, data, sma_cache, last_bar):
+        period = self.bb_period
+        std_dev = self.bb_std
+        
+        close = data['close'].to_numpy()
+        middle = sma_cache[period][-1]
+        std = close[-period:].std(ddof=1)
+        
+        upper = middle + std * std_dev
+        lower = middle - std * std_dev
+        
+        return {
+            'bb_upper': upper,
+            'bb_middle': middle,
+            'bb_lower': lower,
+            'bb_width': (upper - lower) / middle,
+            'bb_position': (last_bar['close'] - lower) / (upper - lower),
+            'bb_squeeze': 1 if (upper - lower) / middle < 0.1 else 0
+        }
+        
+    def _calculate_volume_indicators(self, data, volume_sma, vwap, last_bar):
+        result = {}
+        
+        result['volume_sma'] = volume_sma[-1]
+        result['volume_ratio'] = last_bar['volume'] / volume_sma[-1]
+        
+        obv = self._calculate_obv(data).to_numpy()
+        result['obv'] = obv[-1]
+        result['obv_trend'] = self._calculate_slope(obv)
+        
+        vwap_last = vwap.to_numpy()[-1]
+        result['vwap'] = vwap_last
+        result['vwap_deviation'] = (last_bar['close'] - vwap_last) / vwap_last
+        
+        result['mfi'] = self._calculate_mfi(data)
+        
+        return result
+        
     def _calculate_momentum_indicators(self, data):
-        try:
-            result = {}
-            
-            stoch_k, stoch_d = self._calculate_stochastic(data)
-            result['stoch_k'] = stoch_k.iloc[-1]
-            result['stoch_d'] = stoch_d.iloc[-1]
-            result['stoch_crossover'] = 1 if stoch_k.iloc[-1] > stoch_d.iloc[-1] else 0
-            
-            williams_r = self._calculate_williams_r(data)
-            result['williams_r'] = williams_r.iloc[-1]
-            
-            cci = self._calculate_cci(data)
-            result['cci'] = cci.iloc[-1]
-            
-            roc = self._calculate_roc(data)
-            result['roc'] = roc.iloc[-1]
-            
-            ao = self._calculate_awesome_oscillator(data)
-            result['awesome_oscillator'] = ao.iloc[-1]
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета momentum индикаторов: {e}")
-            return {}
-            
-    def _calculate_volatility_indicators(self, data):
-        try:
-            result = {}
-            
-            atr = self._calculate_atr(data)
-            result['atr'] = atr.iloc[-1]
-            
-            adx = self._calculate_adx(data)
-            result['adx'] = adx.iloc[-1]
-            
-            sar = self._calculate_parabolic_sar(data)
-            result['parabolic_sar'] = sar.iloc[-1]
-            result['sar_signal'] = 1 if data['close'].iloc[-1] > sar.iloc[-1] else 0
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета volatility индикаторов: {e}")
-            return {}
-            
-    def _calculate_vwap_gradient(self, data):
-        try:
-            vwap = self._calculate_vwap(data)
-            
-            gradient = vwap.diff().rolling(window=5).mean()
-            
-            gradient_norm = gradient / vwap * 100
-            
-            gradient_signal = 1 if gradient_norm.iloc[-1] > self.strategy_config['vwap_gradient_threshold'] else 0
-            
-            return {
-                'vwap_gradient': gradient_norm.iloc[-1],
-                'vwap_gradient_signal': gradient_signal,
-                'vwap_trend_strength': abs(gradient_norm.iloc[-1]),
-                'vwap_acceleration': gradient_norm.diff().iloc[-1]
-            }
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета VWAP Gradient: {e}")
-            return {}
-            
-    def _calculate_volume_tsunami(self, data):
-        try:
-            volume_sma = data['volume'].rolling(window=20).mean()
-            
-            volume_ratio = data['volume'].iloc[-1] / volume_sma.iloc[-1]
-            
-            tsunami_signal = 1 if volume_ratio > self.strategy_config['volume_multiplier'] else 0
-            
-            tsunami_strength = min(volume_ratio / self.strategy_config['volume_multiplier'], 3.0)
-            
-            return {
-                'volume_tsunami': volume_ratio,
-                'volume_tsunami_signal': tsunami_signal,
-                'tsunami_strength': tsunami_strength,
-                'volume_acceleration': data['volume'].pct_change().iloc[-1]
-            }
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета Volume Tsunami: {e}")
-            return {}
-            
-    def _calculate_neural_macd(self, data):
-        try:
-            macd_result = self._calculate_macd(data)
-            
-            macd_line = data['close'].ewm(span=12).mean() - data['close'].ewm(span=26).mean()
-            macd_signal = macd_line.ewm(span=9).mean()
-            
-            volatility = data['close'].pct_change().rolling(window=14).std()
-            neural_correction = volatility.iloc[-1] * 0.5
-            
-            neural_macd = macd_line.iloc[-1] + neural_correction
-            
-            neural_signal = 1 if neural_macd > macd_signal.iloc[-1] else 0
-            
-            return {
-                'neural_macd': neural_macd,
-                'neural_macd_signal': neural_signal,
-                'neural_correction': neural_correction,
-                'macd_strength': abs(neural_macd - macd_signal.iloc[-1])
-            }
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета Neural MACD: {e}")
-            return {}
-            
-    def _calculate_quantum_rsi(self, data):
-        try:
-            rsi_result = self._calculate_rsi(data)
-            
-            volume_factor = (data['volume'].iloc[-1] / data['volume'].rolling(window=20).mean().iloc[-1]) * 0.1
-            
-            quantum_rsi = rsi_result['rsi'] + volume_factor
-            quantum_rsi = max(0, min(100, quantum_rsi))
-            
-            quantum_overbought = quantum_rsi > 75
-            quantum_oversold = quantum_rsi < 25
-            
-            quantum_signal = 1 if 30 < quantum_rsi < 70 else 0
-            
-            return {
-                'quantum_rsi': quantum_rsi,
-                'quantum_rsi_signal': quantum_signal,
-                'quantum_overbought': 1 if quantum_overbought else 0,
-                'quantum_oversold': 1 if quantum_oversold else 0,
-                'rsi_momentum': quantum_rsi - rsi_result['rsi']
-            }
-            
-        except Exception as e:
-            logger.error(f"Ошибка расчета Quantum RSI: {e}")
-            return {}
-            
+        result = {}
+        
+        k_last, d_last = self._calculate_stochastic(data)
+        result['stoch_k'] = k_last
+        result['stoch_d'] = d_last
+        result['stoch_crossover'] = 1 if k_last > d_last else 0
+        
+        result['williams_r'] = self._calculate_williams_r(data)
+        result['cci'] = self._calculate_cci(data).to_numpy()[-1]
+        result['roc'] = self._calculate_roc(data).to_numpy()[-1]
+        result['awesome_oscillator'] = self._calculate_awesome_oscillator(data).to_numpy()[-1]
+        
+        return result
+        
+    def _calculate_volatility_indicators(self, data, atr, last_bar):
+        result = {}
+        
+        result['atr'] = atr[-1]
+        result['adx'] = self._calculate_adx(data)[-1]
+        
+        sar_last = self._calculate_parabolic_sar(data).to_numpy()[-1]
+        result['parabolic_sar'] = sar_last
+        result['sar_signal'] = 1 if last_bar['close'] > sar_last else 0
+        
+        return result
+        
+    def _calculate_vwap_gradient(self, data, vwap):
+        gradient = vwap.diff().rolling(window=5).mean()
+        
+        gradient_norm = (gradient / vwap * 100).to_numpy()
+        gradient_last = gradient_norm[-1]
+        
+        gradient_signal = 1 if gradient_last > self.vwap_gradient_threshold else 0
+        
+        return {
+            'vwap_gradient': gradient_last,
+            'vwap_gradient_signal': gradient_signal,
+            'vwap_trend_strength': abs(gradient_last),
+            'vwap_acceleration': gradient_last - gradient_norm[-2]
+        }
+        
+    def _calculate_volume_tsunami(self, data, volume_sma):
+        volume = data['volume'].to_numpy()
+        volume_ratio = volume[-1] / volume_sma[-1]
+        
+        tsunami_signal = 1 if volume_ratio > self.volume_multiplier else 0
+        
+        tsunami_strength = min(volume_ratio / self.volume_multiplier, 3.0)
+        
+        return {
+            'volume_tsunami': volume_ratio,
+            'volume_tsunami_signal': tsunami_signal,
+            'tsunami_strength': tsunami_strength,
+            'volume_acceleration': volume[-1] / volume[-2] - 1
+        }
+        
+    def _calculate_neural_macd(self, data, macd_line, macd_signal):
+        # Волатильность нужна только на последней свече: 14 последних доходностей
+        close = data['close'].to_numpy()[-15:]
+        returns = close[1:] / close[:-1] - 1
+        neural_correction = returns.std(ddof=1) * 0.5
+        
+        neural_macd = macd_line[-1] + neural_correction
+        signal_last = macd_signal[-1]
+        
+        neural_signal = 1 if neural_macd > signal_last else 0
+        
+        return {
+            'neural_macd': neural_macd,
+            'neural_macd_signal': neural_signal,
+            'neural_correction': neural_correction,
+            'macd_strength': abs(neural_macd - signal_last)
+        }
+        
+    def _calculate_quantum_rsi(self, rsi, volume_sma, last_bar):
+        volume_factor = (last_bar['volume'] / volume_sma[-1]) * 0.1
+        
+        quantum_rsi = rsi + volume_factor
+        quantum_rsi = max(0, min(100, quantum_rsi))
+        
+        quantum_overbought = quantum_rsi > 75
+        quantum_oversold = quantum_rsi < 25
+        
+        quantum_signal = 1 if 30 < quantum_rsi < 70 else 0
+        
+        return {
+            'quantum_rsi': quantum_rsi,
+            'quantum_rsi_signal': quantum_signal,
+            'quantum_overbought': 1 if quantum_overbought else 0,
+            'quantum_oversold': 1 if quantum_oversold else 0,
+            'rsi_momentum': quantum_rsi - rsi
+        }
+        
     def _calculate_slope(self, series, window=5):
-        try:
-            if len(series) < window:
-                return 0.0
-            
-            y = series.tail(window).values
-            x = np.arange(len(y))
-            
-            slope = np.polyfit(x, y, 1)[0]
-            return slope
-            
-        except Exception as e:
+        if len(series) < window:
             return 0.0
-            
+        
+        y = np.asarray(series)[-window:]
+        if window == self._SLOPE_WINDOW:
+            x, xx = self._SLOPE_X, self._SLOPE_XX
+        else:
+            x = np.arange(window, dtype=np.float32) - (window - 1) / 2
+            xx = float(x @ x)
+        
+        # МНК-наклон по центрированным x: sum(x * y) / sum(x^2)
+        slope = float(x @ y) / xx
+        return slope if np.isfinite(slope) else 0.0
+        
     def _calculate_obv(self, data):
-        obv = pd.Series(index=data.index, dtype=float)
-        obv.iloc[0] = data['volume'].iloc[0]
-        
-        for i in range(1, len(data)):
-            if data['close'].iloc[i] > data['close'].iloc[i-1]:
-                obv.iloc[i] = obv.iloc[i-1] + data['volume'].iloc[i]
-            elif data['close'].iloc[i] < data['close'].iloc[i-1]:
-                obv.iloc[i] = obv.iloc[i-1] - data['volume'].iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i-1]
-                
-        return obv
+        close = data['close'].to_numpy()
+        volume = data['volume'].to_numpy()
+        
+        signed_volume = np.concatenate(([volume[0]], np.sign(np.diff(close)) * volume[1:]))
+        return pd.Series(np.cumsum(signed_volume), index=data.index)
         
     def _calculate_vwap(self, data):
-        typical_price = (data['high'] + data['low'] + data['close']) / 3
-        vwap = (typical_price * data['volume']).cumsum() / data['volume'].cumsum()
-        return vwap
+        columns = {col: data[col].to_numpy() for col in ('high', 'low', 'close', 'volume')}
+        price_volume = np.cumsum((columns['high'] + columns['low'] + columns['close']) / 3 * columns['volume'])
+        vwap = price_volume / np.cumsum(columns['volume'])
+        return pd.Series(vwap, index=data.index)
         
     def _calculate_mfi(self, data):
-        typical_price = (data['high'] + data['low'] + data['close']) / 3
-        money_flow = typical_price * data['volume']
+        period = 14
+        high, low, close, volume = (data[col].to_numpy() for col in ('high', 'low', 'close', 'volume'))
         
-        positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0)
-        negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0)
+        typical_price = (high[-period - 1:] + low[-period - 1:] + close[-period - 1:]) / 3
+        money_flow = typical_price[1:] * volume[-period:]
         
-        positive_mf = positive_flow.rolling(window=14).sum()
-        negative_mf = negative_flow.rolling(window=14).sum()
+        positive_mf = money_flow[typical_price[1:] > typical_price[:-1]].sum()
+        negative_mf = money_flow[typical_price[1:] < typical_price[:-1]].sum()
         
-        mfi = 100 - (100 / (1 + positive_mf / negative_mf))
-        return mfi
+        return 100 - (100 / (1 + positive_mf / negative_mf))
         
     def _calculate_stochastic(self, data):
-        k_period = self.config['stoch_k']
-        d_period = self.config['stoch_d']
+        k_period = self.stoch_k
+        d_period = self.stoch_d
+        
+        # Для %D нужны только последние d_period значений %K
+        tail = k_period + d_period - 1
+        high, low, close = (data[col].to_numpy()[-tail:] for col in ('high', 'low', 'close'))
         
-        low_k = data['low'].rolling(window=k_period).min()
-        high_k = data['high'].rolling(window=k_period).max()
+        low_k = sliding_window_view(low, k_period).min(axis=1)
+        high_k = sliding_window_view(high, k_period).max(axis=1)
         
-        stoch_k = 100 * (data['close'] - low_k) / (high_k - low_k)
-        stoch_d = stoch_k.rolling(window=d_period).mean()
+        stoch_k = 100 * (close[k_period - 1:] - low_k) / (high_k - low_k)
         
-        return stoch_k, stoch_d
+        return stoch_k[-1], stoch_k.mean()
         
     def _calculate_williams_r(self, data):
-        period = self.config['williams_period']
+        period = self.williams_period
         
-        high_n = data['high'].rolling(window=period).max()
-        low_n = data['low'].rolling(window=period).min()
+        high_n = data['high'].to_numpy()[-period:].max()
+        low_n = data['low'].to_numpy()[-period:].min()
         
-        williams_r = -100 * (high_n - data['close']) / (high_n - low_n)
-        return williams_r
+        return -100 * (high_n - data['close'].to_numpy()[-1]) / (high_n - low_n)
         
     def _calculate_cci(self, data):
-        period = self.config['cci_period']
+        period = self.cci_period
         
-        typical_price = (data['high'] + data['low'] + data['close']) / 3
-        sma = typical_price.rolling(window=period).mean()
-        mad = typical_price.rolling(window=period).apply(lambda x: np.mean(np.abs(x - x.mean())))
+        columns = {col: data[col].to_numpy() for col in ('high', 'low', 'close')}
+        typical_price = (columns['high'] + columns['low'] + columns['close']) / 3
+        windows = sliding_window_view(typical_price, period)
+        sma = windows.mean(axis=1)
+        mad = np.abs(windows - sma[:, None]).mean(axis=1)
         
-        cci = (typical_price - sma) / (0.015 * mad)
-        return cci
+        cci = np.full(len(typical_price), np.nan)
+        cci[period - 1:] = (typical_price[period - 1:] - sma) / (0.015 * mad)
+        return pd.Series(cci, index=data.index)
         
     def _calculate_roc(self, data):
         period = 12
@@ -382,93 +505,42 @@ class TechnicalIndicators:
         return ao
         
     def _calculate_atr(self, data):
-        high_low = data['high'] - data['low']
-        high_close = np.abs(data['high'] - data['close'].shift())
-        low_close = np.abs(data['low'] - data['close'].shift())
-        
-        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-        atr = pd.Series(true_range).rolling(window=14).mean()
-        return atr
-        
-    def _calculate_adx(self, data):
-        period = self.config['adx_period']
-        
-        high_diff = data['high'].diff()
-        low_diff = data['low'].diff()
-        
-        plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
-        minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
+        high, low, close = (data[col].to_numpy() for col in ('high', 'low', 'close'))
         
-        atr = self._calculate_atr(data)
-        plus_di = 100 * (plus_dm.rolling(window=period).sum() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=period).sum() / atr)
+        high_low = high[1:] - low[1:]
+        high_close = np.abs(high[1:] - close[:-1])
+        low_close = np.abs(low[1:] - close[:-1])
         
-        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=period).mean()
+        true_range = np.maximum.reduce([high_low, high_close, low_close])
+        return np.concatenate(([np.nan], _wilder_rma(true_range, 14)))
         
-        return adx
+    def _calculate_adx(self, data):
+        high, low, close = (data[col].to_numpy() for col in ('high', 'low', 'close'))
+        return _adx_kernel(high, low, close, self.adx_period)
         
     def _calculate_parabolic_sar(self, data):
-        config = self.config['parabolic_sar']
-        acceleration = config['acceleration']
-        maximum = config['maximum']
-        
-        sar = pd.Series(index=data.index, dtype=float)
-        trend = 1
-        af = acceleration
-        ep = data['high'].iloc[0] if trend == 1 else data['low'].iloc[0]
-        sar.iloc[0] = data['low'].iloc[0]
-        
-        for i in range(1, len(data)):
-            if trend == 1:
-                sar.iloc[i] = sar.iloc[i-1] + af * (ep - sar.iloc[i-1])
-                
-                if data['high'].iloc[i] > ep:
-                    ep = data['high'].iloc[i]
-                    af = min(af + acceleration, maximum)
-                    
-                if data['low'].iloc[i] < sar.iloc[i]:
-                    trend = -1
-                    sar.iloc[i] = ep
-                    af = acceleration
-                    ep = data['low'].iloc[i]
-            else:
-                sar.iloc[i] = sar.iloc[i-1] - af * (sar.iloc[i-1] - ep)
-                
-                if data['low'].iloc[i] < ep:
-                    ep = data['low'].iloc[i]
-                    af = min(af + acceleration, maximum)
-                    
-                if data['high'].iloc[i] > sar.iloc[i]:
-                    trend = 1
-                    sar.iloc[i] = ep
-                    af = acceleration
-                    ep = data['high'].iloc[i]
-                    
-        return sar
+        sar = _psar_kernel(
+            data['high'].to_numpy(),
+            data['low'].to_numpy(),
+            self.sar_acceleration,
+            self.sar_maximum
+        )
+        return pd.Series(sar, index=data.index)
         
     def _calculate_rsi_divergence(self, data, rsi):
-        try:
-            price_slope = self._calculate_slope(data['close'])
-            rsi_slope = self._calculate_slope(rsi)
-            
-            if (price_slope > 0 and rsi_slope < 0) or (price_slope < 0 and rsi_slope > 0):
-                return 1.0
-            else:
-                return 0.0
-                
-        except Exception as e:
+        price_slope = self._calculate_slope(data['close'])
+        rsi_slope = self._calculate_slope(rsi)
+        
+        if (price_slope > 0 and rsi_slope < 0) or (price_slope < 0 and rsi_slope > 0):
+            return 1.0
+        else:
             return 0.0
-            
+        
     def _calculate_macd_divergence(self, data, macd):
-        try:
-            price_slope = self._calculate_slope(data['close'])
-            macd_slope = self._calculate_slope(macd)
-            
-            if (price_slope > 0 and macd_slope < 0) or (price_slope < 0 and macd_slope > 0):
-                return 1.0
-            else:
-                return 0.0
-                
-        except Exception as e:
+        price_slope = self._calculate_slope(data['close'])
+        macd_slope = self._calculate_slope(macd)
+        
+        if (price_slope > 0 and macd_slope < 0) or (price_slope < 0 and macd_slope > 0):
+            return 1.0
+        else:
             return 0.0
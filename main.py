@@ -16,16 +16,10 @@ from globals import TRADING_PAIRS, TIMEFRAMES, BOT_TOKEN, CHAT_ID
 from telegram_bot import TelegramBotHandler
 from database import Database
 from bot_control import BotController
+from utils import setup_logging
 
-# Настройка логирования
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('trading_bot.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Настройка логирования (запись в файл/консоль в фоновом потоке)
+log_listener = setup_logging(sys.stdout)
 logger = logging.getLogger(__name__)
 
 class TradingBot:
@@ -122,7 +116,7 @@ class TradingBot:
                     "expiration": "N/A",
                     "reasons": ["Бот остановлен"]
                 })
-                await self.telegram.shutdown()  # Этот метод может быть удалён, если его нет в telegram_bot.py
+                await self.telegram.shutdown()
                 
             if self.database:
                 await self.database.close()
@@ -156,4 +150,8 @@ async def main():
         await bot.shutdown()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    finally:
+        # Дописываем оставшиеся в очереди записи лога
+        log_listener.stop()
@@ -4,6 +4,15 @@ import websockets
 import pandas as pd
 from config import *
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson не установлен - стандартный json
+    _loads = json.loads
+
+# Незакрытые свечи не используются - такие сообщения отбрасываются без разбора JSON
+_OPEN_KLINE_MARKER = '"x":false'
+
 class RealTimeData:
     def __init__(self):
         self.data_buffer = {}
@@ -27,11 +36,15 @@ class RealTimeData:
                     print("✅ WebSocket подключен к Binance")
                     while True:
                         message = await self.ws_connection.recv()
-                        await self.process_message(json.loads(message))
+                        if isinstance(message, bytes):
+                            message = message.decode()
+                        if '@kline_' in message[:64] and _OPEN_KLINE_MARKER in message:
+                            continue
+                        await self.process_message(_loads(message))
             except Exception as e:
                 print(f"WebSocket error: {e}, reconnecting in 5 seconds...")
                 await asyncio.sleep(5)
 
     async def process_message(self, message):
-        # ... (остальной код без изменений)
-      
+        stream = message.get('stream', '')
+        self.data_buffer[stream] = message.get('data', {})
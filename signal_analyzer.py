@@ -5,81 +5,168 @@
 
 import asyncio
 import logging
+import os
+from collections import deque
 import numpy as np
 import pandas as pd
-import random
+from functools import lru_cache
+from cachetools import LRUCache, TTLCache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator
 
 from globals import STRATEGY_CONFIG, INDICATOR_WEIGHTS, TRADING_PAIRS, TIMEFRAMES
 from indicators import TechnicalIndicators
 from ai_model import AIPredictor
+from _njit import njit
 
 logger = logging.getLogger(__name__)
 
+# Минимальная длина истории для анализа
+MIN_BARS = 200
+
+# Максимум одновременно анализируемых пар/таймфреймов
+ANALYZE_CONCURRENCY = int(os.getenv("ANALYZE_CONCURRENCY", "16"))
+
+# Базовое время удержания по таймфрейму (минуты)
+HOLD_BASE_TIMES = {
+    "1m": 5,
+    "5m": 15,
+    "15m": 30,
+    "30m": 60,
+    "1h": 120,
+    "4h": 240,
+    "1d": 480
+}
+
+@lru_cache(maxsize=4096)
+def _hold_duration(timeframe: str, accuracy_bucket: int) -> int:
+    """Время удержания по таймфрейму и точности (accuracy_bucket = точность * 10000)"""
+    base_time = HOLD_BASE_TIMES.get(timeframe, 30)
+    
+    # Корректировка по точности
+    accuracy_multiplier = 0.5 + (accuracy_bucket / 10000 * 0.5)
+    
+    # Финальное время
+    hold_duration = int(base_time * accuracy_multiplier)
+    
+    return max(hold_duration, 5)  # Минимум 5 минут
+
+@njit(cache=True)
+def _impulse_strength(volume_tsunami, price_change, roc, tsunami_strength):
+    """Сила импульса уровня 1"""
+    return (
+        min(volume_tsunami, 5.0) * 0.4 +
+        min(price_change * 100.0, 2.0) * 0.3 +
+        min(abs(roc), 2.0) * 0.2 +
+        min(tsunami_strength, 3.0) * 0.1
+    )
+
+@njit(cache=True)
+def _final_score(score1, score2, score3):
+    """Взвешенная сумма уровней с бонусом за сильную конвергенцию"""
+    final_score = score1 * 0.3 + score2 * 0.3 + score3 * 0.4
+    if score1 > 0.8 and score2 > 0.8 and score3 > 0.8:
+        final_score += 0.05
+    return min(final_score, 1.0)
+
+# Компиляция при импорте, а не на первом сигнале
+_impulse_strength(0.0, 0.0, 0.0, 0.0)
+_final_score(0.0, 0.0, 0.0)
+
 class SignalAnalyzer:
-    def __init__(self, telegram_bot, database):
+    # Индикаторы, которые передаются в AI модель после 5 ценовых признаков
+    _KEY_INDICATORS = (
+        'rsi', 'macd', 'macd_histogram', 'bb_position',
+        'volume_ratio', 'vwap_gradient', 'quantum_rsi',
+        'neural_macd', 'volume_tsunami', 'stoch_k',
+        'williams_r', 'cci', 'adx', 'atr'
+    )
+    _N_FEATURES = 5 + len(_KEY_INDICATORS)
+    
+    def __init__(self, telegram_bot, database, executor=None):
         self.telegram = telegram_bot
         self.database = database
         self.indicators = TechnicalIndicators()
+        
+        # Пул потоков для расчета индикаторов (None - расчет в текущем потоке)
+        self.executor = executor
         self.ai_predictor = AIPredictor()
         
         self.config = STRATEGY_CONFIG
         self.weights = INDICATOR_WEIGHTS
         
-        # Кэш для хранения данных
-        self.market_data_cache = {}
-        self.last_signals = {}
-        self.signal_history = []
+        # Пороги стратегии читаются из конфигурации один раз
+        self.vwap_gradient_threshold = float(self.config['vwap_gradient_threshold'])
+        self.rsi_upper_limit = float(self.config['rsi_upper_limit'])
+        self.signal_threshold = float(self.config['signal_threshold'])
+        
+        # Кэш индикаторов: пересчет только при изменении последней свечи
+        self._ind_cache = LRUCache(maxsize=len(TRADING_PAIRS) * len(TIMEFRAMES))
         
-    async def analyze_all_pairs(self, market_data: Dict[str, Dict[str, pd.DataFrame]]) -> List[Dict[str, Any]]:
-        """Анализ всех пар на всех таймфреймах"""
+        # Кэш AI предсказаний по квантованным признакам (живет 30 секунд)
+        self._pred_cache = TTLCache(maxsize=4096, ttl=30)
+        
+        # Кэш для хранения данных (ограниченного размера для долгой работы)
+        self.market_data_cache = LRUCache(maxsize=len(TRADING_PAIRS) * len(TIMEFRAMES) * 2)
+        self.last_signals = TTLCache(maxsize=4096, ttl=3600)
+        self.signal_history = deque(maxlen=10_000)
+        
+    async def analyze_all_pairs(self, market_data: Dict[str, Dict[str, pd.DataFrame]]) -> AsyncIterator[Dict[str, Any]]:
+        """Анализ всех пар на всех таймфреймах: сигналы выдаются по мере готовности"""
+        tasks = []
         try:
             logger.info("🔍 Начинаем анализ всех пар...")
             
-            signals = []
-            tasks = []
+            found = 0
+            semaphore = asyncio.Semaphore(ANALYZE_CONCURRENCY)
             
-            # Создаем задачи для параллельного анализа
+            async def run(pair, timeframe, data):
+                async with semaphore:
+                    return await self._analyze_pair_timeframe(pair, timeframe, data)
+            
+            # Создаем задачи; одновременно выполняется не более ANALYZE_CONCURRENCY
             for pair in TRADING_PAIRS:
+                pair_data = market_data.get(pair, {})
                 for timeframe in TIMEFRAMES:
-                    if pair in market_data and timeframe in market_data[pair]:
-                        task = self._analyze_pair_timeframe(
-                            pair, 
-                            timeframe, 
-                            market_data[pair][timeframe]
-                        )
-                        tasks.append(task)
-            
-            # Выполняем все задачи параллельно
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Собираем результаты
-            for result in results:
+                    # Короткие истории отсекаются до создания задачи
+                    data = pair_data.get(timeframe)
+                    if data is None or len(data) < MIN_BARS:
+                        continue
+                    tasks.append(asyncio.create_task(run(pair, timeframe, data)))
+            
+            # Отдаем сигналы по мере готовности, не дожидаясь самых медленных пар
+            for task in asyncio.as_completed(tasks):
+                try:
+                    result = await task
+                except Exception as e:
+                    logger.error(f"Ошибка анализа: {e}")
+                    continue
+                    
                 if isinstance(result, dict) and result.get('signal'):
-                    signals.append(result)
-                elif isinstance(result, Exception):
-                    logger.error(f"Ошибка анализа: {result}")
-            
-            logger.info(f"📊 Найдено сигналов: {len(signals)}")
+                    found += 1
+                    yield result
             
-            # Сортируем сигналы по точности
-            signals.sort(key=lambda x: x['accuracy'], reverse=True)
-            
-            return signals
+            logger.info(f"📊 Найдено сигналов: {found}")
             
         except Exception as e:
             logger.error(f"Ошибка анализа всех пар: {e}")
-            return []
+        finally:
+            # Если потребитель остановился раньше, незавершенные анализы отменяются
+            for task in tasks:
+                task.cancel()
             
     async def _analyze_pair_timeframe(self, pair: str, timeframe: str, data: pd.DataFrame) -> Dict[str, Any]:
         """Анализ конкретной пары на конкретном таймфрейме"""
         try:
-            if len(data) < 200:  # Недостаточно данных
+            if len(data) < MIN_BARS:  # Недостаточно данных
                 return {}
                 
-            # Расчет всех индикаторов
-            indicators = self.indicators.calculate_all_indicators(data)
+            # Расчет всех индикаторов (без пересчета, если свеча не изменилась)
+            key = self._indicators_key(pair, timeframe, data)
+            indicators = self._ind_cache.get(key)
+            if indicators is None:
+                indicators = await self._calculate_indicators(data)
+                self._ind_cache[key] = indicators
             
             if not indicators:
                 return {}
@@ -93,17 +180,40 @@ class SignalAnalyzer:
             logger.error(f"Ошибка анализа {pair} {timeframe}: {e}")
             return {}
             
+    def _indicators_key(self, pair: str, timeframe: str, data: pd.DataFrame) -> Tuple:
+        """Ключ кэша индикаторов: время и OHLCV последней свечи плюс длина истории"""
+        # Последняя свеча обновляется тиками на месте, поэтому одного времени мало
+        return (pair, timeframe, len(data)) + tuple(
+            data[column].to_numpy()[-1] for column in ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+        )
+        
+    async def _calculate_indicators(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """Расчет индикаторов в пуле потоков, не блокируя цикл событий"""
+        if self.executor is None:
+            return self.indicators.calculate_all_indicators(data)
+            
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.indicators.calculate_all_indicators, data)
+        
     async def _apply_quantum_precision_v2(self, pair: str, timeframe: str, data: pd.DataFrame, indicators: Dict[str, Any]) -> Dict[str, Any]:
         """Применение стратегии Quantum Precision V2"""
         try:
+            # Колонки свечей читаются из DataFrame один раз на весь анализ
+            bars = {column: data[column].to_numpy() for column in ('high', 'low', 'close', 'volume')}
+            
             # Для демонстрации - снижаем требования
             # Трехуровневая верификация сигналов
-            level1_result = await self._level1_momentum_impulse(data, indicators)
-            level2_result = await self._level2_indicator_convergence(data, indicators)
-            level3_result = await self._level3_ai_prediction(pair, timeframe, data, indicators)
+            level1_result = self._level1_momentum_impulse(bars, indicators)
+            level2_result = self._level2_indicator_convergence(data, indicators)
+            
+            # Без хотя бы одного из дешевых уровней порог недостижим - AI не вызываем
+            if not (level1_result['valid'] or level2_result['valid']):
+                return {}
+                
+            level3_result = await self._level3_ai_prediction(pair, timeframe, bars, indicators)
             
             # Для демонстрации - если хотя бы 2 уровня подтверждают сигнал
-            valid_levels = sum([level1_result['valid'], level2_result['valid'], level3_result['valid']])
+            valid_levels = int(level1_result['valid']) + int(level2_result['valid']) + int(level3_result['valid'])
             
             if valid_levels < 2:
                 return {}
@@ -121,22 +231,23 @@ class SignalAnalyzer:
             # Расчет времени удержания
             hold_duration = self._calculate_hold_duration(timeframe, final_score)
             
-            # Создание сигнала
+            # Создание сигнала (время фиксируется один раз)
+            now = datetime.now()
             signal = {
                 'signal': True,
                 'pair': pair,
                 'timeframe': timeframe,
                 'direction': direction,
                 'accuracy': round(final_score * 100, 2),
-                'entry_time': datetime.now().strftime('%H:%M:%S'),
+                'entry_time': now.strftime('%H:%M:%S'),
                 'hold_duration': hold_duration,
                 'vwap_gradient': indicators.get('vwap_gradient', 0),
                 'volume_tsunami': indicators.get('volume_tsunami', 0),
                 'neural_macd': indicators.get('neural_macd', 0),
                 'quantum_rsi': indicators.get('quantum_rsi', 0),
                 'ai_score': round(level3_result['score'] * 100, 2),
-                'current_price': data['close'].iloc[-1],
-                'timestamp': datetime.now().isoformat(),
+                'current_price': bars['close'][-1],
+                'timestamp': now.isoformat(),
                 'indicators': indicators
             }
             
@@ -148,31 +259,36 @@ class SignalAnalyzer:
             logger.error(f"Ошибка применения стратегии: {e}")
             return {}
             
-    async def _level1_momentum_impulse(self, data: pd.DataFrame, indicators: Dict[str, Any]) -> Dict[str, Any]:
+    def _level1_momentum_impulse(self, bars: Dict[str, np.ndarray], indicators: Dict[str, Any]) -> Dict[str, Any]:
         """Уровень 1: Моментальный импульс"""
         try:
+            volume_tsunami = indicators.get('volume_tsunami', 0)
+            roc = indicators.get('roc', 0)
+            
             # Для демонстрации - делаем условия более мягкими
             # Условие 1: Аномальный объем
-            volume_condition = indicators.get('volume_tsunami', 0) > 2.0  # Снижено с 3.2
+            volume_condition = volume_tsunami > 2.0  # Снижено с 3.2
             
             # Условие 2: Значительное изменение цены за минуту
-            price_change_1m = abs(data['close'].pct_change().iloc[-1])
+            close = bars['close']
+            price_change_1m = 0.0 if close.size < 2 else abs(close[-1] / close[-2] - 1.0)
             price_condition = price_change_1m > 0.002  # Снижено с 0.004
             
             # Дополнительные условия - более мягкие
-            momentum_condition = indicators.get('roc', 0) > 0.1  # Снижено с 0.5
+            momentum_condition = roc > 0.1  # Снижено с 0.5
             volatility_condition = indicators.get('atr', 0) > 0  # Всегда true для демонстрации
             
             # Валидация уровня - достаточно 2 условий из 4
-            valid_conditions = sum([volume_condition, price_condition, momentum_condition, volatility_condition])
+            # int() обязателен: условия могут быть np.bool_, для которых + означает логическое ИЛИ
+            valid_conditions = int(volume_condition) + int(price_condition) + int(momentum_condition) + int(volatility_condition)
             valid = valid_conditions >= 2
             
             # Расчет силы импульса
-            impulse_strength = (
-                min(indicators.get('volume_tsunami', 0), 5.0) * 0.4 +
-                min(price_change_1m * 100, 2.0) * 0.3 +
-                min(abs(indicators.get('roc', 0)), 2.0) * 0.2 +
-                min(indicators.get('tsunami_strength', 0), 3.0) * 0.1
+            impulse_strength = _impulse_strength(
+                float(volume_tsunami),
+                float(price_change_1m),
+                float(roc),
+                float(indicators.get('tsunami_strength', 0))
             )
             
             return {
@@ -188,20 +304,21 @@ class SignalAnalyzer:
             logger.error(f"Ошибка Level 1: {e}")
             return {'valid': False, 'score': 0.0}
             
-    async def _level2_indicator_convergence(self, data: pd.DataFrame, indicators: Dict[str, Any]) -> Dict[str, Any]:
+    def _level2_indicator_convergence(self, data: pd.DataFrame, indicators: Dict[str, Any]) -> Dict[str, Any]:
         """Уровень 2: Конвергенция индикаторов"""
         try:
             # Условие 1: MACD histogram > 0
             macd_condition = indicators.get('macd_histogram', 0) > 0
             
             # Условие 2: VWAP gradient > 0.002
-            vwap_condition = indicators.get('vwap_gradient', 0) > self.config['vwap_gradient_threshold']
+            vwap_condition = indicators.get('vwap_gradient', 0) > self.vwap_gradient_threshold
             
             # Условие 3: RSI < 65 (не перекупленность)
-            rsi_condition = indicators.get('quantum_rsi', 50) < self.config['rsi_upper_limit']
+            rsi_condition = indicators.get('quantum_rsi', 50) < self.rsi_upper_limit
             
             # Дополнительные условия конвергенции
-            bollinger_condition = indicators.get('bb_position', 0.5) > 0.2 and indicators.get('bb_position', 0.5) < 0.8
+            bb_position = indicators.get('bb_position', 0.5)
+            bollinger_condition = 0.2 < bb_position < 0.8
             stoch_condition = indicators.get('stoch_crossover', 0) == 1
             volume_condition = indicators.get('volume_ratio', 1) > 1.2
             
@@ -209,7 +326,7 @@ class SignalAnalyzer:
             basic_valid = macd_condition and vwap_condition and rsi_condition
             
             # Дополнительная валидация
-            additional_valid = sum([bollinger_condition, stoch_condition, volume_condition]) >= 2
+            additional_valid = int(bollinger_condition) + int(stoch_condition) + int(volume_condition) >= 2
             
             valid = basic_valid and additional_valid
             
@@ -236,21 +353,21 @@ class SignalAnalyzer:
             logger.error(f"Ошибка Level 2: {e}")
             return {'valid': False, 'score': 0.0}
             
-    async def _level3_ai_prediction(self, pair: str, timeframe: str, data: pd.DataFrame, indicators: Dict[str, Any]) -> Dict[str, Any]:
+    async def _level3_ai_prediction(self, pair: str, timeframe: str, bars: Dict[str, np.ndarray], indicators: Dict[str, Any]) -> Dict[str, Any]:
         """Уровень 3: ИИ-предсказание"""
         try:
             # Подготовка данных для ИИ
-            features = self._prepare_ai_features(data, indicators)
+            features = self._prepare_ai_features(bars, indicators)
             
-            # Получение предсказания от ИИ
-            ai_prediction = await self.ai_predictor.predict(features, pair, timeframe)
+            # Получение предсказания от ИИ (почти одинаковые признаки берутся из кэша)
+            ai_prediction = await self._predict_cached(features, pair, timeframe)
             
             # Условие: AI предсказание >= 0.87
-            ai_condition = ai_prediction >= self.config['signal_threshold']
+            ai_condition = ai_prediction >= self.signal_threshold
             
             # Дополнительные проверки
             confidence_condition = ai_prediction >= 0.80
-            pattern_condition = await self._detect_patterns(data, indicators)
+            pattern_condition = self._detect_patterns(bars, indicators)
             
             valid = ai_condition and confidence_condition and pattern_condition
             
@@ -266,47 +383,51 @@ class SignalAnalyzer:
         except Exception as e:
             logger.error(f"Ошибка Level 3: {e}")
             # Fallback на упрощенную логику
-            return await self._fallback_prediction(data, indicators)
+            return self._fallback_prediction(bars, indicators)
+            
+    async def _predict_cached(self, features: np.ndarray, pair: str, timeframe: str) -> float:
+        """AI предсказание с кэшем по признакам, квантованным до 0.001"""
+        quantized = np.nan_to_num(np.rint(features * 1000), nan=0.0, posinf=0.0, neginf=0.0)
+        key = (pair, timeframe, tuple(quantized.astype(np.int64).tolist()))
+        
+        prediction = self._pred_cache.get(key)
+        if prediction is None:
+            prediction = await self.ai_predictor.predict(features, pair, timeframe)
+            self._pred_cache[key] = prediction
             
-    def _prepare_ai_features(self, data: pd.DataFrame, indicators: Dict[str, Any]) -> np.ndarray:
+        return prediction
+        
+    def _prepare_ai_features(self, bars: Dict[str, np.ndarray], indicators: Dict[str, Any]) -> np.ndarray:
         """Подготовка признаков для ИИ"""
         try:
-            features = []
+            features = np.empty(self._N_FEATURES, dtype=np.float64)
             
             # Ценовые данные
-            features.extend([
-                data['close'].iloc[-1],
-                data['high'].iloc[-1],
-                data['low'].iloc[-1],
-                data['volume'].iloc[-1],
-                data['close'].pct_change().iloc[-1]
-            ])
+            close = bars['close']
+            features[0] = close[-1]
+            features[1] = bars['high'][-1]
+            features[2] = bars['low'][-1]
+            features[3] = bars['volume'][-1]
+            features[4] = close[-1] / close[-2] - 1.0 if close.size > 1 else 0.0
             
             # Индикаторы
-            key_indicators = [
-                'rsi', 'macd', 'macd_histogram', 'bb_position',
-                'volume_ratio', 'vwap_gradient', 'quantum_rsi',
-                'neural_macd', 'volume_tsunami', 'stoch_k',
-                'williams_r', 'cci', 'adx', 'atr'
-            ]
-            
-            for indicator in key_indicators:
-                features.append(indicators.get(indicator, 0))
+            for i, indicator in enumerate(self._KEY_INDICATORS, start=5):
+                features[i] = indicators.get(indicator, 0)
                 
-            return np.array(features, dtype=float)
+            return features
             
         except Exception as e:
             logger.error(f"Ошибка подготовки признаков: {e}")
-            return np.zeros(20)
+            return np.zeros(self._N_FEATURES)
             
-    async def _detect_patterns(self, data: pd.DataFrame, indicators: Dict[str, Any]) -> bool:
+    def _detect_patterns(self, bars: Dict[str, np.ndarray], indicators: Dict[str, Any]) -> bool:
         """Детекция графических паттернов"""
         try:
             # Простые паттерны
             patterns = []
             
             # Паттерн пробоя
-            breakout_pattern = self._detect_breakout(data, indicators)
+            breakout_pattern = self._detect_breakout(bars, indicators)
             patterns.append(breakout_pattern)
             
             # Паттерн дивергенции
@@ -328,7 +449,7 @@ class SignalAnalyzer:
             logger.error(f"Ошибка детекции паттернов: {e}")
             return False
             
-    def _detect_breakout(self, data: pd.DataFrame, indicators: Dict[str, Any]) -> bool:
+    def _detect_breakout(self, bars: Dict[str, np.ndarray], indicators: Dict[str, Any]) -> bool:
         """Детекция пробоя"""
         try:
             # Пробой полос Боллинджера
@@ -338,9 +459,9 @@ class SignalAnalyzer:
             )
             
             # Пробой уровней поддержки/сопротивления
-            current_price = data['close'].iloc[-1]
-            resistance_level = data['high'].rolling(20).max().iloc[-1]
-            support_level = data['low'].rolling(20).min().iloc[-1]
+            current_price = bars['close'][-1]
+            resistance_level = bars['high'][-20:].max()
+            support_level = bars['low'][-20:].min()
             
             resistance_breakout = current_price > resistance_level * 1.001
             support_breakout = current_price < support_level * 0.999
@@ -351,7 +472,7 @@ class SignalAnalyzer:
             logger.error(f"Ошибка детекции пробоя: {e}")
             return False
             
-    async def _fallback_prediction(self, data: pd.DataFrame, indicators: Dict[str, Any]) -> Dict[str, Any]:
+    def _fallback_prediction(self, bars: Dict[str, np.ndarray], indicators: Dict[str, Any]) -> Dict[str, Any]:
         """Упрощенное предсказание без ИИ"""
         try:
             # Простая логика на основе индикаторов
@@ -378,8 +499,13 @@ class SignalAnalyzer:
             if indicators.get('bb_squeeze', 0) >= 0:  # Всегда добавляем
                 score += 0.1
                 
-            # Для демонстрации - добавим случайный фактор
-            if random.random() > 0.7:  # 30% шанс на бонус
+            # Для демонстрации - бонус как детерминированная функция индикаторов (~1/8 случаев)
+            # RSI на плоском ряду и MACD в начале истории бывают NaN - подставляем значения по умолчанию
+            rsi = indicators.get('rsi', 50)
+            macd_histogram = indicators.get('macd_histogram', 0)
+            rsi_bits = int((rsi if np.isfinite(rsi) else 50) * 100)
+            macd_bits = int((macd_histogram if np.isfinite(macd_histogram) else 0) * 1000)
+            if (rsi_bits ^ macd_bits) & 7 == 0:
                 score += 0.1
                 
             # Нормализация
@@ -400,18 +526,8 @@ class SignalAnalyzer:
     def _calculate_final_score(self, level1: Dict[str, Any], level2: Dict[str, Any], level3: Dict[str, Any]) -> float:
         """Расчет финального скора"""
         try:
-            # Взвешенная сумма всех уровней
-            final_score = (
-                level1['score'] * 0.3 +
-                level2['score'] * 0.3 +
-                level3['score'] * 0.4
-            )
-            
-            # Бонус за сильную конвергенцию
-            if level1['score'] > 0.8 and level2['score'] > 0.8 and level3['score'] > 0.8:
-                final_score += 0.05
-                
-            return min(final_score, 1.0)
+            # Взвешенная сумма всех уровней и бонус за сильную конвергенцию
+            return _final_score(float(level1['score']), float(level2['score']), float(level3['score']))
             
         except Exception as e:
             logger.error(f"Ошибка расчета финального скора: {e}")
@@ -451,26 +567,8 @@ class SignalAnalyzer:
     def _calculate_hold_duration(self, timeframe: str, accuracy: float) -> int:
         """Расчет времени удержания позиции"""
         try:
-            # Базовое время по таймфрейму
-            base_times = {
-                "1m": 5,
-                "5m": 15,
-                "15m": 30,
-                "30m": 60,
-                "1h": 120,
-                "4h": 240,
-                "1d": 480
-            }
-            
-            base_time = base_times.get(timeframe, 30)
-            
-            # Корректировка по точности
-            accuracy_multiplier = 0.5 + (accuracy * 0.5)
-            
-            # Финальное время
-            hold_duration = int(base_time * accuracy_multiplier)
-            
-            return max(hold_duration, 5)  # Минимум 5 минут
+            # Точность квантуется до 0.0001, чтобы ключ кэша был целым и ограниченным
+            return _hold_duration(timeframe, int(round(accuracy * 10000)))
             
         except Exception as e:
             logger.error(f"Ошибка расчета времени удержания: {e}")
@@ -1,32 +1,68 @@
-import requests
+import asyncio
+import aiohttp
 from globals import BOT_TOKEN, CHAT_ID
 
+# Общая сессия: keep-alive и одно TLS-соединение на все отправки
+_session = None
+
+def _get_session():
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=75, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    return _session
+
+# Шаблон сообщения с сигналом: разбирается один раз, поля подставляются через %
+_TEMPLATE = (
+    "%(emoji)s *QUOTEX SIGNAL* %(emoji)s\n\n"
+    "• Актив: `%(pair)s`\n"
+    "• Таймфрейм: `%(timeframe)s`\n"
+    "• Направление: `%(direction)s`\n"
+    "• Точность: `%(confidence).2f%%`\n"
+    "• Цена: `%(price).6f`\n"
+    "• Экспирация: `%(expiration)s`\n\n"
+    "📊 *Обоснование:*\n%(patterns)s\n\n"
+    "_Сгенерировано AI QuotexSignalNet v1.0_"
+)
+
 class TelegramBotHandler:
     def __init__(self, token, chat_id):
         self.token = token
         self.chat_id = chat_id
+        self._url = f"https://api.telegram.org/bot{token}/sendMessage"
+        
+        # Очередь сообщений и единственный отправитель (без упора в лимиты Telegram)
+        self._queue = asyncio.Queue()
+        self._consumer = None
 
     async def initialize(self):
         # Пустой метод для совместимости
         pass
 
     async def send_signal(self, signal):
-        direction_emoji = "🟢" if signal['direction'] == 'UP' else "🔴"
-        patterns = "\n".join([f"• {p}" for p in signal.get('reasons', [])])
-        
-        message = (
-            f"{direction_emoji} *QUOTEX SIGNAL* {direction_emoji}\n\n"
-            f"• Актив: `{signal['pair']}`\n"
-            f"• Таймфрейм: `{signal['timeframe']}`\n"
-            f"• Направление: `{signal['direction']}`\n"
-            f"• Точность: `{signal['confidence']:.2f}%`\n"
-            f"• Цена: `{signal['price']:.6f}`\n"
-            f"• Экспирация: `{signal['expiration']}`\n\n"
-            f"📊 *Обоснование:*\n{patterns}\n\n"
-            f"_Сгенерировано AI QuotexSignalNet v1.0_"
-        )
+        context = {
+            **signal,
+            'emoji': "🟢" if signal['direction'] == 'UP' else "🔴",
+            'patterns': "\n".join(f"• {p}" for p in signal.get('reasons', ()))
+        }
+        message = _TEMPLATE % context
         
-        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._consume())
+        await self._queue.put(message)
+
+    async def _consume(self):
+        # Сообщения отправляются по очереди через одно keep-alive соединение
+        while True:
+            message = await self._queue.get()
+            try:
+                await self._post(message)
+            finally:
+                self._queue.task_done()
+
+    async def _post(self, message):
         payload = {
             'chat_id': self.chat_id,
             'text': message,
@@ -34,11 +70,42 @@ class TelegramBotHandler:
         }
         
         try:
-            response = requests.post(url, json=payload)
-            if response.status_code != 200:
-                print(f"Telegram error: {response.text}")
+            async with _get_session().post(self._url, json=payload) as response:
+                if response.status != 200:
+                    print(f"Telegram error: {await response.text()}")
         except Exception as e:
             print(f"Telegram send error: {str(e)}")
 
+    async def shutdown(self):
+        # Досылаем накопленные сообщения и закрываем общую HTTP-сессию
+        global _session
+        if self._consumer is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=10)
+            except asyncio.TimeoutError:
+                print("Telegram: не все сообщения отправлены до остановки")
+            self._consumer.cancel()
+            self._consumer = None
+        if _session is not None and not _session.closed:
+            await _session.close()
+        _session = None
+
     # Добавляем псевдоним send_message для send_signal
     send_message = send_signal
+
+# Обработчик по умолчанию для модулей, которые импортируют send_signal напрямую:
+# создается при первой отправке, а не при импорте модуля
+_default_handler = None
+
+async def send_signal(signal):
+    global _default_handler
+    if _default_handler is None:
+        _default_handler = TelegramBotHandler(BOT_TOKEN, CHAT_ID)
+    await _default_handler.send_signal(signal)
+
+async def shutdown():
+    # Остановка обработчика по умолчанию: досылка очереди и закрытие общей сессии
+    global _default_handler
+    if _default_handler is not None:
+        await _default_handler.shutdown()
+        _default_handler = None
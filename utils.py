@@ -3,21 +3,32 @@
 """
 
 import logging
+import logging.handlers
+import queue
 import time
 import asyncio
 
 logger = logging.getLogger(__name__)
 
-def setup_logging():
-    """Настройка логирования"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('trading_bot.log'),
-            logging.StreamHandler()
-        ]
-    )
+def setup_logging(stream=None):
+    """Настройка логирования: запись в файл и консоль выполняется в фоновом потоке"""
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler('trading_bot.log'),
+        logging.StreamHandler(stream)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        
+    # Логгеры только кладут записи в очередь, не блокируя цикл событий
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
 
 async def async_sleep(seconds: float):
     """Асинхронная задержка"""
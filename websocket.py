@@ -1,19 +1,190 @@
 import asyncio
 import logging
-import json
-import websockets
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import aiohttp
-from urllib.parse import urlencode
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 
-from globals import BINANCE_WS_URL, TRADING_PAIRS, TIMEFRAMES, SAFETY_LIMITS
+try:
+    import numexpr as ne
+except ImportError:  # numexpr не установлен - запасная генерация свечей на чистом NumPy
+    ne = None
+
+try:
+    import polars as pl
+except ImportError:  # polars не установлен - данные доступны только как pandas
+    pl = None
+
+# aiohttp нужен только REST-загрузке и импортируется в ней, не при импорте модуля
+if TYPE_CHECKING:
+    import aiohttp
+
+from _njit import njit, prange, NUMBA_AVAILABLE
+from globals import (
+    BINANCE_WS_URL, BINANCE_REST_URL, SIMULATE_MARKET_DATA, TRADING_PAIRS, TIMEFRAMES, SAFETY_LIMITS
+)
 
 logger = logging.getLogger(__name__)
 
+# Copy-on-Write: кадры отдаются без копий, копия создается только при изменении (в pandas 3 включен всегда)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Колонки свечи в кольцевом буфере
+COL_OPEN, COL_HIGH, COL_LOW, COL_CLOSE, COL_VOLUME = range(5)
+CANDLE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Количество хранимых свечей на пару/таймфрейм
+HISTORY_SIZE = 500
+
+# Период тиков симуляции (секунды)
+UPDATE_INTERVAL = 1.0
+
+# Максимум одновременных REST-запросов истории
+REST_CONCURRENCY = 10
+
+# Период обновления свечей через REST без симуляции (секунды)
+REST_POLL_INTERVAL = 60.0
+
+# Частота pandas для таймфрейма (длительность свечи)
+TIMEFRAME_FREQS = {
+    '1m': '1min',
+    '5m': '5min',
+    '15m': '15min',
+    '30m': '30min',
+    '1h': '1h',
+    '4h': '4h',
+    '1d': '1D'
+}
+
+# Начальные цены симуляции
+BASE_PRICES = {
+    'BTCUSDT': 65000,
+    'ETHUSDT': 3500,
+    'BNBUSDT': 600,
+    'ADAUSDT': 0.45,
+    'XRPUSDT': 0.60,
+    'SOLUSDT': 150,
+    'DOGEUSDT': 0.25
+}
+
+def _utc_now() -> np.datetime64:
+    """Текущее время UTC без часового пояса - в одной шкале с метками свечей Binance"""
+    return np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), 'ns')
+
+@njit(parallel=True, cache=True)
+def _gen_candles(base_prices, price_changes, close_changes, high_noise, low_noise, out):
+    """OHLC симуляции по строкам-потокам: каждая свеча открывается от закрытия предыдущей"""
+    n_streams, n_bars = price_changes.shape
+    for s in prange(n_streams):
+        price = base_prices[s]
+        for t in range(n_bars):
+            open_price = price * (1.0 + price_changes[s, t])
+            close_price = open_price * (1.0 + close_changes[s, t])
+            out[s, t, COL_OPEN] = open_price
+            out[s, t, COL_HIGH] = open_price * (1.0 + high_noise[s, t])
+            out[s, t, COL_LOW] = open_price * (1.0 - low_noise[s, t])
+            out[s, t, COL_CLOSE] = close_price
+            price = close_price
+
+def _gen_candles_numpy(base_prices, price_changes, close_changes, high_noise, low_noise, out):
+    """Векторный вариант _gen_candles без Numba: цепочка цен через cumprod, арифметика через numexpr (если есть)"""
+    if ne is None:
+        growth = (1 + price_changes) * (1 + close_changes)
+        close_prices = base_prices[:, None] * np.cumprod(growth, axis=1)
+        open_prices = close_prices / (1 + close_changes)
+        out[:, :, COL_OPEN] = open_prices
+        out[:, :, COL_HIGH] = open_prices * (1 + high_noise)
+        out[:, :, COL_LOW] = open_prices * (1 - low_noise)
+        out[:, :, COL_CLOSE] = close_prices
+        return
+        
+    growth = ne.evaluate("(1 + price_changes) * (1 + close_changes)")
+    close_prices = base_prices[:, None] * np.cumprod(growth, axis=1)
+    open_prices = ne.evaluate("close_prices / (1 + close_changes)")
+    out[:, :, COL_OPEN] = open_prices
+    out[:, :, COL_HIGH] = ne.evaluate("open_prices * (1 + high_noise)")
+    out[:, :, COL_LOW] = ne.evaluate("open_prices * (1 - low_noise)")
+    out[:, :, COL_CLOSE] = close_prices
+
+# Без Numba поэлементный цикл медленнее векторного NumPy
+_generate_candles = _gen_candles if NUMBA_AVAILABLE else _gen_candles_numpy
+
+@njit(cache=True)
+def _tick_update(close, high, low, volume, price_growth, volume_change):
+    """Тик по всем потокам за один проход: закрытие, экстремумы и объем последней свечи"""
+    for i in range(close.size):
+        c = close[i] * price_growth[i]
+        close[i] = c
+        if c > high[i]:
+            high[i] = c
+        if c < low[i]:
+            low[i] = c
+        volume[i] += volume_change[i]
+
+def _tick_update_numpy(close, high, low, volume, price_growth, volume_change):
+    """Векторный вариант _tick_update без Numba"""
+    close *= price_growth
+    np.maximum(high, close, out=high)
+    np.minimum(low, close, out=low)
+    volume += volume_change
+
+_apply_tick = _tick_update if NUMBA_AVAILABLE else _tick_update_numpy
+
+class RingBuffer:
+    """Кольцевой буфер свечей с зеркальной копией: строки i и i + capacity совпадают,
+    поэтому хронологическое окно всегда один непрерывный срез без копирования"""
+    
+    def __init__(self, capacity: int = HISTORY_SIZE, dtype=np.float32):
+        self.capacity = capacity
+        self.data = np.empty((2 * capacity, len(CANDLE_COLUMNS)), dtype=dtype)
+        self.ts = np.empty(2 * capacity, dtype='datetime64[ns]')
+        self.head = 0
+        self.size = 0
+        
+    @property
+    def last(self) -> int:
+        """Строка последней записанной свечи"""
+        return (self.head - 1) % self.capacity
+        
+    def load(self, timestamps: np.ndarray, ohlcv: np.ndarray):
+        """Загрузка истории (последние capacity свечей) одной записью"""
+        n = min(len(timestamps), self.capacity)
+        for start in (0, self.capacity):
+            self.ts[start:start + n] = timestamps[len(timestamps) - n:]
+            self.data[start:start + n] = ohlcv[len(ohlcv) - n:]
+        self.head = n % self.capacity
+        self.size = n
+        
+    def append(self, timestamp, ohlcv):
+        """Новая свеча на месте самой старой, без перераспределения памяти"""
+        for row in (self.head, self.head + self.capacity):
+            self.ts[row] = timestamp
+            self.data[row] = ohlcv
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        
+    def update_last(self, high, low, close, volume):
+        """Перезапись изменяемых полей последней свечи (в обеих копиях)"""
+        last = self.last
+        for row in (last, last + self.capacity):
+            self.data[row, COL_HIGH] = high
+            self.data[row, COL_LOW] = low
+            self.data[row, COL_CLOSE] = close
+            self.data[row, COL_VOLUME] = volume
+            
+    def ordered(self):
+        """Метки времени и OHLCV в хронологическом порядке - срез-представление без копии"""
+        start = self.head if self.size == self.capacity else 0
+        return self.ts[start:start + self.size], self.data[start:start + self.size]
+        
+    def snapshot(self):
+        """Копия окна ordered(): последующие append/update_last ее не затрагивают"""
+        timestamps, ohlcv = self.ordered()
+        return timestamps.copy(), ohlcv.copy()
+
 class BinanceWebSocket:
-    def __init__(self):
+    def __init__(self, dtype=np.float32):
         self.ws_url = BINANCE_WS_URL
         self.pairs = TRADING_PAIRS
         self.timeframes = TIMEFRAMES
@@ -21,6 +192,38 @@ class BinanceWebSocket:
         self.market_data = {}
         self.is_running = False
         
+        # Тип OHLCV: float32 вдвое компактнее, точности хватает симуляции и индикаторам (np.float64 - полная)
+        self.dtype = np.dtype(dtype)
+        
+        # Свечи по парам/таймфреймам в кольцевых буферах, DataFrame строится по ним при чтении
+        self._buffers = {}
+        self._stale_frames = set()
+        
+        # Единый генератор случайных чисел симуляции (история и тики)
+        self._rng = np.random.default_rng()
+        
+        # Кэш статистики: пересобирается только после загрузки истории или открытия новых свечей
+        self._stats_cache = None
+        self._stats_dirty = True
+        
+        # Последние свечи всех потоков в матрицах (n_pairs, n_timeframes) для пакетного тика
+        shape = (len(self.pairs), len(self.timeframes))
+        self._last_close = np.full(shape, np.nan, dtype=self.dtype)
+        self._last_high = np.full(shape, np.nan, dtype=self.dtype)
+        self._last_low = np.full(shape, np.nan, dtype=self.dtype)
+        self._last_volume = np.full(shape, np.nan, dtype=self.dtype)
+        self._last_synced = True
+        
+        # Строки и колонки матриц по паре и таймфрейму
+        self._pair_rows = {pair: i for i, pair in enumerate(self.pairs)}
+        self._timeframe_cols = {timeframe: j for j, timeframe in enumerate(self.timeframes)}
+        
+        # Время открытия следующей свечи каждого потока
+        self._intervals = pd.to_timedelta(
+            [TIMEFRAME_FREQS.get(timeframe, '1min') for timeframe in self.timeframes]
+        ).to_numpy().astype('timedelta64[ns]')
+        self._next_open = np.full(shape, np.datetime64('NaT'), dtype='datetime64[ns]')
+        
         # Инициализация структуры данных
         self._initialize_market_data()
         
@@ -28,11 +231,95 @@ class BinanceWebSocket:
         """Инициализация структуры рыночных данных"""
         for pair in self.pairs:
             self.market_data[pair] = {}
+            self._buffers[pair] = {}
             for timeframe in self.timeframes:
-                self.market_data[pair][timeframe] = pd.DataFrame(columns=[
-                    'timestamp', 'open', 'high', 'low', 'close', 'volume'
-                ])
+                self._buffers[pair][timeframe] = RingBuffer(dtype=self.dtype)
+                self._refresh_frame(pair, timeframe)
+                
+        # Постоянный список потоков для горячих циклов: (строка, колонка матриц, пара, таймфрейм, буфер)
+        self._hot_refs = [
+            (i, j, pair, timeframe, self._buffers[pair][timeframe])
+            for i, pair in enumerate(self.pairs)
+            for j, timeframe in enumerate(self.timeframes)
+        ]
+                
+    def _refresh_frame(self, pair: str, timeframe: str):
+        """DataFrame-снимок буфера: колонки только для чтения, память не разделяется с буфером"""
+        # Копия обязательна: append пишет в строку, которая была нулевой строкой ранее выданных кадров,
+        # а анализ читает кадры в пуле потоков параллельно с тиками
+        timestamps, ohlcv = self._buffers[pair][timeframe].snapshot()
+        columns = {'timestamp': self._readonly(timestamps)}
+        for col, name in enumerate(CANDLE_COLUMNS):
+            columns[name] = self._readonly(ohlcv[:, col])
+        self.market_data[pair][timeframe] = pd.DataFrame(columns, copy=False)
+        
+    @staticmethod
+    def _readonly(values: np.ndarray) -> np.ndarray:
+        """Представление массива только для чтения: потребители не могут изменить исходные свечи"""
+        view = values.view()
+        view.flags.writeable = False
+        return view
+        
+    def _stack_last_bars(self):
+        """Сборка последних свечей всех потоков в матрицы для пакетного обновления"""
+        now = _utc_now()
+        
+        for i, j, _, _, buffer in self._hot_refs:
+            if buffer.size > 0:
+                last = buffer.last
+                self._last_close[i, j] = buffer.data[last, COL_CLOSE]
+                self._last_high[i, j] = buffer.data[last, COL_HIGH]
+                self._last_low[i, j] = buffer.data[last, COL_LOW]
+                self._last_volume[i, j] = buffer.data[last, COL_VOLUME]
                 
+                # Следующая свеча - первая граница интервала после текущего момента, а не в прошлом
+                interval = self._intervals[j]
+                elapsed = max(now - buffer.ts[last], np.timedelta64(0, 'ns'))
+                self._next_open[i, j] = buffer.ts[last] + (elapsed // interval + 1) * interval
+                    
+        self._last_synced = True
+        self._stats_dirty = True
+        
+    def _sync_last_bars(self):
+        """Перенос накопленных тиков из матриц в последние свечи буферов"""
+        if self._last_synced:
+            return
+            
+        for i, j, pair, timeframe, buffer in self._hot_refs:
+            if buffer.size > 0:
+                buffer.update_last(
+                    self._last_high[i, j], self._last_low[i, j], self._last_close[i, j], self._last_volume[i, j]
+                )
+                # Выданные кадры - снимки, новый тик попадет только в пересобранный кадр
+                self._stale_frames.add((pair, timeframe))
+                
+        self._last_synced = True
+        
+    def _sync_market_data(self):
+        """Синхронизация DataFrame с буферами (только при чтении данных)"""
+        self._sync_last_bars()
+        for pair, timeframe in self._stale_frames:
+            self._refresh_frame(pair, timeframe)
+        self._stale_frames.clear()
+        
+    def _roll_candles(self, due: np.ndarray):
+        """Открытие новых свечей в потоках, у которых истек интервал текущей"""
+        self._sync_last_bars()
+        
+        for i, j in zip(*np.nonzero(due)):
+            pair = self.pairs[i]
+            timeframe = self.timeframes[j]
+            close = self._last_close[i, j]
+            self._buffers[pair][timeframe].append(self._next_open[i, j], (close, close, close, close, 0.0))
+            self._stale_frames.add((pair, timeframe))
+            self._next_open[i, j] += self._intervals[j]
+            
+        self._stats_dirty = True
+        
+        self._last_high[due] = self._last_close[due]
+        self._last_low[due] = self._last_close[due]
+        self._last_volume[due] = 0.0
+        
     async def initialize(self):
         """Инициализация WebSocket соединений"""
         try:
@@ -53,12 +340,21 @@ class BinanceWebSocket:
     async def _fetch_historical_data(self):
         """Получение исторических данных через REST API"""
         try:
-            logger.info("📊 Загрузка симуляции исторических данных...")
-            
-            # Симуляция данных для демонстрации
-            await self._generate_simulated_data()
-            
-            logger.info("✅ Симуляция исторических данных загружена")
+            if SIMULATE_MARKET_DATA:
+                logger.info("📊 Загрузка симуляции исторических данных...")
+                
+                # Симуляция данных для демонстрации
+                await self._generate_simulated_data()
+                
+                logger.info("✅ Симуляция исторических данных загружена")
+            else:
+                logger.info("📊 Загрузка исторических данных с Binance...")
+                
+                await self._fetch_all()
+                
+                logger.info("✅ Исторические данные загружены")
+                
+            self._stack_last_bars()
             
         except Exception as e:
             logger.error(f"Ошибка загрузки исторических данных: {e}")
@@ -67,78 +363,73 @@ class BinanceWebSocket:
     async def _generate_simulated_data(self):
         """Генерация симуляции данных для тестирования"""
         try:
-            import random
-            import numpy as np
-            
-            for pair in self.pairs:
-                base_price = {
-                    'BTCUSDT': 65000,
-                    'ETHUSDT': 3500,
-                    'BNBUSDT': 600,
-                    'ADAUSDT': 0.45,
-                    'XRPUSDT': 0.60,
-                    'SOLUSDT': 150,
-                    'DOGEUSDT': 0.25
-                }.get(pair, 100)
+            uniform = self._rng.uniform
+            n_pairs = len(self.pairs)
+            n_timeframes = len(self.timeframes)
+            shape = (n_pairs * n_timeframes, HISTORY_SIZE)
+            
+            # Начальная цена каждого потока (строки идут парами, внутри - таймфреймы)
+            base_prices = np.repeat(
+                np.array([BASE_PRICES.get(pair, 100) for pair in self.pairs], dtype=np.float64),
+                n_timeframes
+            )
+            
+            # Случайное движение цены и шум OHLC одним пакетом на все потоки и свечи
+            price_changes = uniform(-0.05, 0.05, shape)  # ±5%
+            close_changes = uniform(-0.01, 0.01, shape)
+            high_noise = uniform(0, 0.02, shape)
+            low_noise = uniform(0, 0.02, shape)
+            
+            ohlcv = np.empty(shape + (len(CANDLE_COLUMNS),), dtype=self.dtype)
+            _generate_candles(base_prices, price_changes, close_changes, high_noise, low_noise, ohlcv)
+            ohlcv[:, :, COL_VOLUME] = uniform(1000, 10000, shape)
+            
+            # Метки времени выровнены по границам интервала: последняя (текущая) свеча открыта
+            # на последней границе, следующая откроется на ближайшей будущей
+            current_time = pd.Timestamp(_utc_now())
+            
+            for j, timeframe in enumerate(self.timeframes):
+                freq = TIMEFRAME_FREQS.get(timeframe, '1min')
+                timestamps = pd.date_range(
+                    end=current_time.floor(freq), periods=HISTORY_SIZE, freq=freq
+                ).to_numpy()
                 
-                for timeframe in self.timeframes:
-                    # Генерация 500 исторических свечей
-                    df_data = []
-                    current_time = datetime.now()
-                    
-                    # Определение интервала времени
-                    time_delta = {
-                        '1m': timedelta(minutes=1),
-                        '5m': timedelta(minutes=5),
-                        '15m': timedelta(minutes=15),
-                        '30m': timedelta(minutes=30),
-                        '1h': timedelta(hours=1),
-                        '4h': timedelta(hours=4),
-                        '1d': timedelta(days=1)
-                    }.get(timeframe, timedelta(minutes=1))
-                    
-                    price = base_price
-                    
-                    for i in range(500):
-                        # Генерация случайного движения цены
-                        price_change = random.uniform(-0.05, 0.05)  # ±5%
-                        price = price * (1 + price_change)
-                        
-                        # Генерация OHLC данных
-                        open_price = price
-                        high_price = price * (1 + abs(random.uniform(0, 0.02)))
-                        low_price = price * (1 - abs(random.uniform(0, 0.02)))
-                        close_price = price * (1 + random.uniform(-0.01, 0.01))
-                        volume = random.uniform(1000, 10000)
-                        
-                        candle_time = current_time - (time_delta * (500 - i))
-                        
-                        df_data.append({
-                            'timestamp': candle_time,
-                            'open': open_price,
-                            'high': high_price,
-                            'low': low_price,
-                            'close': close_price,
-                            'volume': volume
-                        })
-                        
-                        price = close_price
-                        
-                    self.market_data[pair][timeframe] = pd.DataFrame(df_data)
-                    logger.debug(f"📈 Симуляция данных создана: {pair} {timeframe} - {len(df_data)} свечей")
+                for i, pair in enumerate(self.pairs):
+                    self._buffers[pair][timeframe].load(timestamps, ohlcv[i * n_timeframes + j])
+                    self._refresh_frame(pair, timeframe)
+                    logger.debug(f"📈 Симуляция данных создана: {pair} {timeframe} - {len(timestamps)} свечей")
                     
         except Exception as e:
             logger.error(f"Ошибка генерации симуляции данных: {e}")
             raise
             
-    async def _fetch_pair_timeframe_data(self, session: aiohttp.ClientSession, base_url: str, pair: str, timeframe: str):
+    async def _fetch_all(self):
+        """Параллельная загрузка истории всех пар и таймфреймов (не более REST_CONCURRENCY запросов сразу)"""
+        import aiohttp
+        
+        semaphore = asyncio.Semaphore(REST_CONCURRENCY)
+        
+        async def fetch(session, pair, timeframe):
+            async with semaphore:
+                await self._fetch_pair_timeframe_data(session, BINANCE_REST_URL, pair, timeframe)
+                
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+            await asyncio.gather(*(
+                fetch(session, pair, timeframe)
+                for pair in self.pairs
+                for timeframe in self.timeframes
+            ))
+            
+    async def _fetch_pair_timeframe_data(self, session: 'aiohttp.ClientSession', base_url: str, pair: str, timeframe: str):
         """Получение данных для конкретной пары и таймфрейма"""
+        from urllib.parse import urlencode
+        
         try:
             # Параметры запроса
             params = {
                 'symbol': pair,
                 'interval': timeframe,
-                'limit': 500
+                'limit': HISTORY_SIZE
             }
             
             url = f"{base_url}?{urlencode(params)}"
@@ -147,20 +438,15 @@ class BinanceWebSocket:
                 if response.status == 200:
                     data = await response.json()
                     
-                    df_data = []
-                    for candle in data:
-                        df_data.append({
-                            'timestamp': pd.to_datetime(candle[0], unit='ms'),
-                            'open': float(candle[1]),
-                            'high': float(candle[2]),
-                            'low': float(candle[3]),
-                            'close': float(candle[4]),
-                            'volume': float(candle[5])
-                        })
-                        
-                    self.market_data[pair][timeframe] = pd.DataFrame(df_data)
+                    # Время открытия - одно векторное преобразование, OHLCV - одна матрица float
+                    open_times = np.array([candle[0] for candle in data], dtype=np.int64)
+                    timestamps = pd.to_datetime(open_times, unit='ms').to_numpy()
+                    ohlcv = np.array([candle[1:6] for candle in data], dtype=np.float64).reshape(-1, len(CANDLE_COLUMNS))
+                    
+                    self._buffers[pair][timeframe].load(timestamps, ohlcv)
+                    self._refresh_frame(pair, timeframe)
                     
-                    logger.debug(f"📈 Данные загружены: {pair} {timeframe} - {len(df_data)} свечей")
+                    logger.debug(f"📈 Данные загружены: {pair} {timeframe} - {len(data)} свечей")
                     
                 else:
                     logger.error(f"Ошибка загрузки данных {pair} {timeframe}: {response.status}")
@@ -183,16 +469,23 @@ class BinanceWebSocket:
             raise
             
     async def start_data_stream(self):
-        """Запуск потока данных - симуляция"""
+        """Запуск потока данных: симуляция тиков или периодическая загрузка реальных свечей"""
         try:
             if self.is_running:
                 return
                 
             self.is_running = True
-            logger.info("🚀 Запуск симуляции потока данных...")
             
-            # Запуск симуляции обновления данных
-            await self._simulate_data_updates()
+            if SIMULATE_MARKET_DATA:
+                logger.info("🚀 Запуск симуляции потока данных...")
+                
+                # Запуск симуляции обновления данных
+                await self._simulate_data_updates()
+            else:
+                logger.info("🚀 Запуск обновления данных через REST...")
+                
+                # Без симуляции цены только с Binance: случайные тики поверх реальной истории не применяются
+                await self._poll_rest_updates()
             
         except Exception as e:
             logger.error(f"Ошибка запуска потока данных: {e}")
@@ -202,49 +495,79 @@ class BinanceWebSocket:
             
     async def _simulate_data_updates(self):
         try:
-            import random
+            uniform = self._rng.uniform
+            shape = self._last_close.shape
+            due = np.empty(shape, dtype=bool)
+            
+            # Тики по монотонным дедлайнам: время обработки не накапливает сдвиг
+            loop = asyncio.get_running_loop()
+            deadline = loop.time()
             
             while self.is_running:
-                # Обновление данных для каждой пары
-                for pair in self.pairs:
-                    for timeframe in self.timeframes:
-                        if pair in self.market_data and timeframe in self.market_data[pair]:
-                            df = self.market_data[pair][timeframe]
-                            
-                            if len(df) > 0:
-                                # Получение последней свечи
-                                last_candle = df.iloc[-1].copy()
-                                
-                                # Обновление цены с небольшим случайным изменением
-                                price_change = random.uniform(-0.001, 0.001)  # ±0.1%
-                                new_close = last_candle['close'] * (1 + price_change)
-                                
-                                # Обновление данных последней свечи
-                                df.iloc[-1, df.columns.get_loc('close')] = new_close
-                                df.iloc[-1, df.columns.get_loc('high')] = max(last_candle['high'], new_close)
-                                df.iloc[-1, df.columns.get_loc('low')] = min(last_candle['low'], new_close)
-                                df.iloc[-1, df.columns.get_loc('volume')] = last_candle['volume'] + random.uniform(10, 100)
-                                
-                                logger.debug(f"📊 Симуляция обновления: {pair} {timeframe} - {new_close:.4f}")
+                # Обновление всех пар и таймфреймов одним пакетом случайных изменений
+                # Множитель цены сразу в виде 1 ± 0.1%: без промежуточного массива 1 + change
+                price_growth = uniform(0.999, 1.001, shape)
+                volume_change = uniform(10, 100, shape)
+                
+                _apply_tick(
+                    self._last_close.ravel(), self._last_high.ravel(), self._last_low.ravel(),
+                    self._last_volume.ravel(), price_growth.ravel(), volume_change.ravel()
+                )
+                self._last_synced = False
+                
+                # Открытие новых свечей по истечении интервала: старейшая свеча вытесняется из буфера
+                np.less_equal(self._next_open, _utc_now(), out=due)
+                if due.any():
+                    self._roll_candles(due)
                 
-                # Пауза между обновлениями
-                await asyncio.sleep(1)
+                logger.debug(f"📊 Симуляция обновления: {self._last_close.size} потоков")
+                
+                # Пауза до следующего дедлайна
+                deadline += UPDATE_INTERVAL
+                delay = deadline - loop.time()
+                if delay < 0:
+                    logger.warning(f"⚠️ Тик симуляции опоздал на {-delay:.3f} с")
+                    # Пропущенные тики не догоняются пачкой
+                    deadline = loop.time()
+                    delay = 0
+                await asyncio.sleep(delay)
                 
         except Exception as e:
             logger.error(f"Ошибка симуляции обновления данных: {e}")
             self.is_running = False
             
+    async def _poll_rest_updates(self):
+        """Периодическая перезагрузка свечей с Binance (последняя свеча - текущая незакрытая)"""
+        try:
+            while self.is_running:
+                await asyncio.sleep(REST_POLL_INTERVAL)
+                if not self.is_running:
+                    break
+                    
+                await self._fetch_all()
+                self._stack_last_bars()
+                
+                logger.debug(f"📊 Обновление REST: {self._last_close.size} потоков")
+                
+        except Exception as e:
+            logger.error(f"Ошибка обновления данных через REST: {e}")
+            self.is_running = False
+            
     def get_market_data(self) -> Dict[str, Dict[str, pd.DataFrame]]:
-        """Получение рыночных данных"""
-        return self.market_data.copy()
+        """Получение рыночных данных (кадры - снимки только для чтения, общие для всех читателей до следующего тика)"""
+        self._sync_market_data()
+        return {pair: dict(frames) for pair, frames in self.market_data.items()}
         
     def get_latest_price(self, pair: str) -> Optional[float]:
         """Получение последней цены для пары"""
         try:
-            if pair in self.market_data and '1m' in self.market_data[pair]:
-                df = self.market_data[pair]['1m']
-                if len(df) > 0:
-                    return df['close'].iloc[-1]
+            # Текущее закрытие минутной свечи читается прямо из матрицы тиков, без pandas
+            row = self._pair_rows.get(pair)
+            col = self._timeframe_cols.get('1m')
+            if row is not None and col is not None:
+                price = self._last_close[row, col]
+                if not np.isnan(price):
+                    return float(price)
             return None
             
         except Exception as e:
@@ -254,14 +577,37 @@ class BinanceWebSocket:
     def get_pair_timeframe_data(self, pair: str, timeframe: str) -> Optional[pd.DataFrame]:
         """Получение данных для конкретной пары и таймфрейма"""
         try:
+            self._sync_market_data()
             if pair in self.market_data and timeframe in self.market_data[pair]:
-                return self.market_data[pair][timeframe].copy()
+                # Поверхностная копия: при Copy-on-Write данные не копируются, а присваивание колонки
+                # меняет только кадр вызывающего; запись на месте в колонки только для чтения - ошибка
+                return self.market_data[pair][timeframe].copy(deep=False)
             return None
             
         except Exception as e:
             logger.error(f"Ошибка получения данных {pair} {timeframe}: {e}")
             return None
             
+    def get_pair_timeframe_data_pl(self, pair: str, timeframe: str) -> Optional['pl.DataFrame']:
+        """Получение данных пары и таймфрейма как Polars DataFrame (собирается из буфера, минуя pandas)"""
+        try:
+            if pl is None:
+                logger.error("Polars не установлен")
+                return None
+                
+            self._sync_last_bars()
+            if pair in self._buffers and timeframe in self._buffers[pair]:
+                timestamps, ohlcv = self._buffers[pair][timeframe].snapshot()
+                columns = {'timestamp': timestamps}
+                for col, name in enumerate(CANDLE_COLUMNS):
+                    columns[name] = ohlcv[:, col]
+                return pl.DataFrame(columns)
+            return None
+            
+        except Exception as e:
+            logger.error(f"Ошибка получения данных Polars {pair} {timeframe}: {e}")
+            return None
+            
     async def shutdown(self):
         """Закрытие всех соединений"""
         try:
@@ -296,7 +642,10 @@ class BinanceWebSocket:
         }
         
     def get_data_statistics(self) -> Dict[str, Any]:
-        """Получение статистики данных"""
+        """Получение статистики данных (общий кэшированный словарь - не изменять)"""
+        if not self._stats_dirty:
+            return self._stats_cache
+            
         stats = {
             'total_pairs': len(self.pairs),
             'total_timeframes': len(self.timeframes),
@@ -309,12 +658,14 @@ class BinanceWebSocket:
             stats['latest_updates'][pair] = {}
             
             for timeframe in self.timeframes:
-                df = self.market_data[pair][timeframe]
-                stats['data_points'][pair][timeframe] = len(df)
+                buffer = self._buffers[pair][timeframe]
+                stats['data_points'][pair][timeframe] = buffer.size
                 
-                if len(df) > 0:
-                    stats['latest_updates'][pair][timeframe] = df['timestamp'].iloc[-1].isoformat()
+                if buffer.size > 0:
+                    stats['latest_updates'][pair][timeframe] = pd.Timestamp(buffer.ts[buffer.last]).isoformat()
                 else:
                     stats['latest_updates'][pair][timeframe] = None
                     
+        self._stats_cache = stats
+        self._stats_dirty = False
         return stats